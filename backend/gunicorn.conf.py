@@ -0,0 +1,94 @@
+"""Gunicorn settings for the ``web`` process: ``gunicorn -c gunicorn.conf.py``.
+
+Every value can be overridden from the environment (see .env.example).
+Gunicorn binds to ``0.0.0.0:$PORT`` by default when ``PORT`` is set.
+"""
+import os
+
+import environ
+
+env = environ.Env()
+environ.Env.read_env(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env"))
+
+
+def _cpu_count():
+    # Containers often see every host CPU in os.cpu_count(); the affinity
+    # mask reflects what this process may actually run on.
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+CPUS = _cpu_count()
+ASYNC = env.bool("API_ASYNC_VIEWS", default=False)
+# Without Redis the cache is per process: cache invalidation, rate limits
+# and warm-up would each only reach one worker. Run a single worker then.
+SHARED_CACHE = bool(env("REDIS_URL", default=None))
+# Each worker is a full Django process (~100 MB), so the CPU-based default
+# is capped; set WEB_CONCURRENCY to go higher.
+MAX_DEFAULT_WORKERS = 8
+
+if ASYNC:
+    # One event loop per core; see "ASGI Mode" in the README.
+    wsgi_app = "pro_portfolio.asgi:application"
+    worker_class = "uvicorn.workers.UvicornWorker"
+    default_workers = min(CPUS, MAX_DEFAULT_WORKERS)
+else:
+    # Requests mostly wait on Postgres and the cache, so a few threads per
+    # worker keep cores busy without the memory of more processes.
+    wsgi_app = "pro_portfolio.wsgi:application"
+    worker_class = "gthread"
+    default_workers = min(CPUS * 2 + 1, MAX_DEFAULT_WORKERS)
+    threads = env.int("GUNICORN_THREADS", default=4)
+workers = env.int("WEB_CONCURRENCY", default=default_workers if SHARED_CACHE else 1)
+
+# Import Django and the app once in the master; workers fork with it loaded
+# and share those pages copy-on-write.
+preload_app = True
+
+# Recycle workers to bound slow leaks; jitter keeps them from restarting together.
+max_requests = env.int("GUNICORN_MAX_REQUESTS", default=2000)
+max_requests_jitter = env.int("GUNICORN_MAX_REQUESTS_JITTER", default=max_requests // 10)
+
+timeout = env.int("GUNICORN_TIMEOUT", default=30)
+graceful_timeout = env.int("GUNICORN_GRACEFUL_TIMEOUT", default=30)
+keepalive = env.int("GUNICORN_KEEPALIVE", default=5)
+
+# Heartbeat files on tmpfs; a disk-backed /tmp can stall workers into timeouts.
+if os.path.isdir("/dev/shm"):
+    worker_tmp_dir = "/dev/shm"
+
+
+def on_starting(server):
+    if workers > 1 and not SHARED_CACHE:
+        server.log.warning(
+            "Running %s workers without REDIS_URL: each worker has its own cache, so "
+            "admin edits, rate limits and warm-up only reach one of them. Set REDIS_URL "
+            "or WEB_CONCURRENCY=1.",
+            workers,
+        )
+
+
+def post_fork(server, worker):
+    """Give each worker clean metrics and a warm response cache."""
+    from django.db import connections
+
+    from portfolio.instrumentation import store
+    from portfolio.warmup import warm_up
+
+    # Nothing should connect in the master, but never share its sockets.
+    connections.close_all()
+    store.reset()
+    try:
+        statuses = warm_up()
+    except Exception:
+        server.log.exception("Worker %s: warm-up failed; serving cold.", worker.pid)
+        return
+    finally:
+        # The warm-up connection belongs to this (main) thread, which never
+        # serves requests; keeping it would idle one connection per worker.
+        connections.close_all()
+    failed = [path for path, status in statuses.items() if status != 200]
+    if failed:
+        server.log.warning("Worker %s: warm-up got errors for %s", worker.pid, ", ".join(failed))
@@ -1,6 +1,7 @@
 from django.contrib import admin
+from django.utils import timezone
 
-from .models import Blog, ContactMessage, Education, Experience, Project, Skill
+from .models import Blog, ContactMessage, Education, Experience, Project, Skill, WebhookOutbox
 
 
 @admin.register(Project)
@@ -13,7 +14,8 @@ class ProjectAdmin(admin.ModelAdmin):
 
 @admin.register(Skill)
 class SkillAdmin(admin.ModelAdmin):
-    list_display = ("name", "category")
+    list_display = ("name", "category", "proficiency_level", "featured_rank")
+    list_editable = ("featured_rank",)
     search_fields = ("name",)
     list_filter = ("category",)
 
@@ -29,17 +31,57 @@ class EducationAdmin(admin.ModelAdmin):
     list_display = ("degree", "institution", "start_year", "end_year")
 
 
+class WebhookOutboxInline(admin.TabularInline):
+    model = WebhookOutbox
+    extra = 0
+    can_delete = False
+    fields = ("status", "attempts", "last_status_code", "last_error", "next_attempt_at", "delivered_at")
+    readonly_fields = fields
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
+
 @admin.register(ContactMessage)
 class ContactMessageAdmin(admin.ModelAdmin):
     list_display = ("name", "email", "service", "budget", "timeline", "phone", "timestamp")
     search_fields = ("name", "email", "service", "budget", "timeline", "phone", "message")
     readonly_fields = ("timestamp",)
     ordering = ("-timestamp",)
+    inlines = [WebhookOutboxInline]
+
+
+@admin.register(WebhookOutbox)
+class WebhookOutboxAdmin(admin.ModelAdmin):
+    list_display = ("contact_message", "status", "attempts", "last_status_code", "next_attempt_at", "delivered_at")
+    list_filter = ("status",)
+    search_fields = ("contact_message__name", "contact_message__email", "last_error")
+    readonly_fields = (
+        "contact_message",
+        "payload",
+        "attempts",
+        "last_status_code",
+        "last_error",
+        "created_at",
+        "delivered_at",
+    )
+    ordering = ("-created_at",)
+    actions = ["retry_now"]
+
+    @admin.action(description="Retry selected deliveries now")
+    def retry_now(self, request, queryset):
+        updated = queryset.exclude(status=WebhookOutbox.Status.DELIVERED).update(
+            status=WebhookOutbox.Status.PENDING,
+            attempts=0,
+            next_attempt_at=timezone.now(),
+        )
+        self.message_user(request, f"{updated} delivery(ies) queued for retry.")
 
 @admin.register(Blog)
 class BlogAdmin(admin.ModelAdmin):
-    list_display = ['title', 'short_desc', 'created_at']  # fields to show in list
+    list_display = ['title', 'short_desc', 'published_on', 'read_time']  # fields to show in list
     search_fields = ['title']
+    date_hierarchy = 'published_on'
     
 
 
@@ -5,3 +5,8 @@ class PortfolioConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'portfolio'
     verbose_name = "Portfolio Content"
+
+    def ready(self):
+        from .signals import connect_signals
+
+        connect_signals()
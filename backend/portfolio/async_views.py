@@ -0,0 +1,207 @@
+"""Async versions of the API views, routed when ``API_ASYNC_VIEWS`` is on.
+
+Validation, schemas and caching are shared with ``views``; only the I/O
+differs. Single-query reads use the async ORM. Reads that need several
+queries (search, bootstrap, home skills) run in one ``sync_to_async`` call,
+because Django's async ORM pays a thread hop per query anyway.
+"""
+import asyncio
+import logging
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.shortcuts import aget_object_or_404
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_GET, require_http_methods
+
+from .models import Blog, Education, Project, Skill
+from .pagination import InvalidPage, apaginate_keyset
+from .projections import BLOG_SCHEMA, EDUCATION_SCHEMA, PROJECT_SCHEMA, SKILL_SCHEMA, InvalidFields
+from .ratelimit import rate_limit
+from .response_cache import cached_response
+from .responses import FastJsonResponse
+from .search import search_content
+from .views import (
+    BOOTSTRAP_PARAMS,
+    FIELDS_PARAMS,
+    LIST_PARAMS,
+    PROJECT_LIST_PARAMS,
+    SEARCH_PARAMS,
+    InvalidContact,
+    InvalidFilter,
+    InvalidQuery,
+    _bootstrap_last_modified,
+    _bootstrap_sections,
+    _contact_fields,
+    _create_contact,
+    _filter_projects,
+    _latest_update,
+    _search_last_modified,
+    _search_params,
+    _select_home_skills,
+    _slug_update,
+    build_bootstrap_payload,
+)
+from .webhooks import deliver_now
+
+logger = logging.getLogger(__name__)
+
+# Inline webhook attempts still running; the event loop only keeps weak
+# references to tasks.
+_background_tasks = set()
+
+
+def _task_done(task):
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Inline webhook delivery crashed", exc_info=task.exception())
+
+
+def _spawn(coroutine):
+    task = asyncio.create_task(coroutine)
+    _background_tasks.add(task)
+    task.add_done_callback(_task_done)
+
+
+async def _rows(queryset):
+    return [row async for row in queryset]
+
+
+async def _list(request, schema, queryset, key, filters=None):
+    try:
+        fields = schema.requested_fields(request)
+        if filters is not None:
+            queryset = filters(request, queryset)
+        selection = schema.select(queryset, fields, extra=("id", key))
+        page = await apaginate_keyset(request, selection, key=key)
+    except (InvalidFields, InvalidFilter, InvalidPage) as exc:
+        return FastJsonResponse({"detail": str(exc)}, status=400)
+
+    if page is not None:
+        return FastJsonResponse({"results": selection.encode_all(page.items), "next": page.next_cursor})
+    return FastJsonResponse(selection.encode_all(await _rows(selection.queryset)), safe=False)
+
+
+async def _detail(request, schema, slug):
+    try:
+        fields = schema.requested_fields(request, detail=True)
+    except InvalidFields as exc:
+        return FastJsonResponse({"detail": str(exc)}, status=400)
+    selection = schema.select(fields=fields)
+    return FastJsonResponse(selection.encode(await aget_object_or_404(selection.queryset, slug=slug)))
+
+
+async def _all(request, schema):
+    try:
+        fields = schema.requested_fields(request)
+    except InvalidFields as exc:
+        return FastJsonResponse({"detail": str(exc)}, status=400)
+    selection = schema.select(fields=fields)
+    return FastJsonResponse(selection.encode_all(await _rows(selection.queryset)), safe=False)
+
+
+# ── Read views ───────────────────────────────────────────────────────────────
+
+@require_GET
+@cached_response("projects", params=PROJECT_LIST_PARAMS, last_modified=_latest_update(Project))
+async def project_list(request):
+    return await _list(
+        request,
+        PROJECT_SCHEMA,
+        Project.objects.order_by("-created_at", "-id"),
+        "created_at",
+        filters=_filter_projects,
+    )
+
+
+@require_GET
+@cached_response("projects", params=FIELDS_PARAMS, last_modified=_slug_update(Project))
+async def project_detail(request, slug):
+    return await _detail(request, PROJECT_SCHEMA, slug)
+
+
+@require_GET
+@cached_response("blogs", params=LIST_PARAMS, last_modified=_latest_update(Blog))
+async def blog_list(request):
+    return await _list(request, BLOG_SCHEMA, Blog.objects.order_by("-published_on", "-id"), "published_on")
+
+
+@require_GET
+@cached_response("blogs", params=FIELDS_PARAMS, last_modified=_slug_update(Blog))
+async def blog_detail(request, slug):
+    return await _detail(request, BLOG_SCHEMA, slug)
+
+
+@require_GET
+@cached_response("skills", params=FIELDS_PARAMS, last_modified=_latest_update(Skill))
+async def skill_list(request):
+    return await _all(request, SKILL_SCHEMA)
+
+
+@require_GET
+@cached_response("skills", params=FIELDS_PARAMS, last_modified=_latest_update(Skill))
+async def home_skill_list(request):
+    try:
+        fields = SKILL_SCHEMA.requested_fields(request)
+    except InvalidFields as exc:
+        return FastJsonResponse({"detail": str(exc)}, status=400)
+
+    try:
+        return FastJsonResponse(await sync_to_async(_select_home_skills)(fields), safe=False)
+    except Exception as e:
+        logger.error("Error in home_skill_list view: %s", e, exc_info=True)
+        return FastJsonResponse({"detail": "An internal error occurred."}, status=500)
+
+
+@require_GET
+@cached_response("education", params=FIELDS_PARAMS, last_modified=_latest_update(Education))
+async def education_list(request):
+    return await _all(request, EDUCATION_SCHEMA)
+
+
+@require_GET
+@cached_response("projects", "blogs", params=SEARCH_PARAMS, last_modified=_search_last_modified)
+async def search(request):
+    try:
+        query, limit = _search_params(request)
+    except InvalidQuery as exc:
+        return FastJsonResponse({"detail": str(exc)}, status=400)
+    results = await sync_to_async(search_content)(query, limit)
+    return FastJsonResponse({"query": query, "results": results})
+
+
+@require_GET
+@cached_response(
+    "projects",
+    "blogs",
+    "skills",
+    "education",
+    params=BOOTSTRAP_PARAMS,
+    last_modified=_bootstrap_last_modified,
+)
+async def bootstrap(request):
+    try:
+        sections = _bootstrap_sections(request)
+    except InvalidFields as exc:
+        return FastJsonResponse({"detail": str(exc)}, status=400)
+    return FastJsonResponse(await sync_to_async(build_bootstrap_payload)(sections))
+
+
+# ── Contact view ─────────────────────────────────────────────────────────────
+
+@csrf_exempt
+@require_http_methods(["POST"])
+@rate_limit("contact", limit=5, window=3600)
+async def contact_message_create(request):
+    try:
+        data = _contact_fields(request.body)
+    except InvalidContact as exc:
+        return FastJsonResponse({"detail": str(exc)}, status=400)
+
+    entry = await sync_to_async(_create_contact)(data)
+    # Under ASGI the server's event loop outlives the response, so the
+    # webhook is attempted right away without holding the request open.
+    # Under WSGI the per-request loop would cancel it; the worker sends it.
+    if entry is not None and isinstance(request, ASGIRequest):
+        _spawn(deliver_now(entry.pk))
+    return FastJsonResponse({"detail": "Message submitted successfully."}, status=201)
@@ -0,0 +1,330 @@
+import asyncio
+import statistics
+import threading
+import time
+import tracemalloc
+import uuid
+from contextlib import contextmanager
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.db import connection
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from .models import BLOG_SEARCH_VECTOR, PROJECT_SEARCH_VECTOR, Blog, Education, Project, Skill, WebhookOutbox
+from .rendering import content_hash, read_time_for, render_description
+from .urls import urlpatterns
+from .webhooks import adeliver, build_session, deliver
+
+
+def synthetic_projects(count):
+    now = timezone.now()
+    return [
+        {
+            "id": uuid.uuid4(),
+            "title": f"Project {index}",
+            "slug": f"project-{index}",
+            "short_desc": "Production-ready platform with a React frontend and Django API.",
+            "tech_stack": ["Django", "React", "PostgreSQL", "Redis"][: 1 + index % 4],
+            "image_url": f"https://cdn.example.com/projects/{index}/cover.webp",
+            "images": [f"https://cdn.example.com/projects/{index}/{shot}.webp" for shot in range(3)],
+            "live_url": f"https://project-{index}.example.com",
+            "github_url": f"https://github.com/example/project-{index}",
+            "category": ("fullstack", "mobile", "ai")[index % 3],
+            "created_at": now,
+            "updated_at": now,
+        }
+        for index in range(count)
+    ]
+
+
+def time_call(func, repeat):
+    """Run ``func`` ``repeat`` times and return per-call durations in milliseconds."""
+    durations = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - started) * 1000)
+    return durations
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(durations):
+    return {
+        "mean_ms": statistics.fmean(durations) if durations else 0.0,
+        "p50_ms": percentile(durations, 50),
+        "p95_ms": percentile(durations, 95),
+        "p99_ms": percentile(durations, 99),
+    }
+
+
+# ── Endpoint benchmarks (manage.py bench) ────────────────────────────────────
+
+# Endpoints that write are not benchmarked.
+WRITE_ENDPOINTS = {"contact-message-create"}
+# Query strings for endpoints that need one to return 200.
+ENDPOINT_QUERIES = {"search": {"q": "django caching"}}
+
+
+def seed_dataset(size):
+    """Replace all portfolio content with ``size`` projects, blogs and skills.
+
+    Rows are bulk-inserted, so the fields ``save()`` derives are filled in
+    directly: rendered HTML and hashes once (rows share their text) and search
+    vectors with one UPDATE per table.
+    """
+    for model in (Project, Blog, Skill, Education):
+        model.objects.all().delete()
+
+    description = "Built a **Django** API with Redis caching and a React frontend.\n\n" * 5
+    description_html = render_description(description)
+    description_hash = content_hash(description)
+    projects = [
+        Project(
+            **{key: value for key, value in row.items() if key not in {"created_at", "updated_at"}},
+            description=description,
+            description_html=description_html,
+            description_hash=description_hash,
+        )
+        for row in synthetic_projects(size)
+    ]
+    Project.objects.bulk_create(projects, batch_size=1000)
+    Project.objects.update(search_vector=PROJECT_SEARCH_VECTOR)
+
+    story = "How we tuned **Django** and PostgreSQL for a read-heavy portfolio.\n\n" * 20
+    story_html = render_description(story)
+    story_hash = content_hash(story)
+    read_time = read_time_for(story)
+    today = timezone.localdate()
+    blogs = [
+        Blog(
+            title=f"Blog {index}",
+            slug=f"blog-{index}",
+            short_desc="Notes on caching and query tuning.",
+            category="Engineering",
+            read_time=read_time,
+            published_on=today - timedelta(days=index % 3650),
+            date=f"Post {index}",
+            story=story,
+            story_html=story_html,
+            story_hash=story_hash,
+            highlights=["Caching", "Indexes"],
+        )
+        for index in range(size)
+    ]
+    Blog.objects.bulk_create(blogs, batch_size=1000)
+    Blog.objects.update(search_vector=BLOG_SEARCH_VECTOR)
+
+    categories = [choice for choice, _ in Skill.Category.choices]
+    Skill.objects.bulk_create(
+        [
+            Skill(
+                name=f"Skill {index}",
+                category=categories[index % len(categories)],
+                proficiency_level=1 + index % 100,
+                featured_rank=index + 1 if index < 5 else None,
+            )
+            for index in range(size)
+        ],
+        batch_size=1000,
+    )
+    # A resume has a handful of education entries whatever the dataset size.
+    Education.objects.bulk_create(
+        [
+            Education(degree=f"Degree {index}", institution="Example University", start_year=2000 + index)
+            for index in range(10)
+        ]
+    )
+
+
+def endpoint_paths():
+    """Yield ``(url_name, path, query)`` for every read endpoint in ``portfolio.urls``."""
+    samples = {
+        "slug": {
+            "project-detail": Project.objects.values_list("slug", flat=True).first(),
+            "blog-detail": Blog.objects.values_list("slug", flat=True).first(),
+        }
+    }
+    for pattern in urlpatterns:
+        name = pattern.name
+        if name in WRITE_ENDPOINTS:
+            continue
+        kwargs = {key: samples[key][name] for key in pattern.pattern.converters}
+        yield name, reverse(name, kwargs=kwargs), ENDPOINT_QUERIES.get(name, {})
+
+
+class BenchmarkError(Exception):
+    pass
+
+
+class QueryTimer:
+    """``connection.execute_wrapper`` hook counting queries and timing them precisely.
+
+    ``connection.queries`` rounds each query to the millisecond, which turns
+    fast queries into 0.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.seconds += time.perf_counter() - started
+            self.count += 1
+
+
+def _get(client, path, query):
+    response = client.get(path, query)
+    if response.status_code != 200:
+        raise BenchmarkError(f"GET {path} {query or ''} returned {response.status_code}, expected 200.")
+    return response
+
+
+def measure_endpoint(client, path, query, repeat):
+    """Return latency percentiles, SQL stats and peak memory for GET ``path``."""
+    response = _get(client, path, query)  # Warm-up; also checks the endpoint works.
+    durations, query_counts, db_times = [], [], []
+    for _ in range(repeat):
+        timer = QueryTimer()
+        with connection.execute_wrapper(timer):
+            started = time.perf_counter()
+            _get(client, path, query)
+            durations.append((time.perf_counter() - started) * 1000)
+        query_counts.append(timer.count)
+        db_times.append(timer.seconds * 1000)
+
+    tracemalloc.start()
+    try:
+        _get(client, path, query)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "status": response.status_code,
+        "bytes": len(response.content),
+        **summarize(durations),
+        "queries": max(query_counts, default=0),
+        "db_ms": statistics.fmean(db_times) if db_times else 0.0,
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def run_benchmarks(sizes, repeat, log=None):
+    """Seed each dataset size and measure every read endpoint against it.
+
+    Raises ``BenchmarkError`` when an endpoint does not answer 200.
+    """
+    client = Client()
+    results = {}
+    # SECURE_SSL_REDIRECT is on whenever DEBUG is off; every measurement
+    # would be a redirect.
+    with override_settings(SECURE_SSL_REDIRECT=False):
+        for size in sizes:
+            seed_dataset(size)
+            results[str(size)] = {}
+            for name, path, query in endpoint_paths():
+                results[str(size)][name] = measure_endpoint(client, path, query, repeat)
+                if log is not None:
+                    log(size, name, results[str(size)][name])
+    return results
+
+
+def compare_results(baseline, current, threshold, min_delta_ms=1.0):
+    """Return regressions of ``current`` against ``baseline`` as readable strings.
+
+    Latency regresses when p95 grows by more than ``threshold`` (a fraction)
+    and by at least ``min_delta_ms``; any increase in query count regresses.
+    """
+    regressions = []
+    for size, endpoints in current.items():
+        for name, stats in endpoints.items():
+            before = baseline.get(size, {}).get(name)
+            if before is None:
+                continue
+            delta = stats["p95_ms"] - before["p95_ms"]
+            if delta >= min_delta_ms and stats["p95_ms"] > before["p95_ms"] * (1 + threshold):
+                regressions.append(
+                    f"{name} @ {size}: p95 {before['p95_ms']:.2f} ms -> {stats['p95_ms']:.2f} ms"
+                )
+            if stats["queries"] > before["queries"]:
+                regressions.append(f"{name} @ {size}: queries {before['queries']} -> {stats['queries']}")
+    return regressions
+
+
+# ── Slow-upstream concurrency (manage.py bench --slow-upstream) ──────────────
+
+@contextmanager
+def slow_upstream(delay):
+    """Serve a local webhook endpoint that answers every POST after ``delay`` seconds."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            time.sleep(delay)
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, format, *args):
+            pass
+
+    class Server(ThreadingHTTPServer):
+        daemon_threads = True
+        request_queue_size = 1024
+
+    server = Server(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/hook"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def run_upstream_benchmark(concurrency, delay_ms):
+    """Deliver ``concurrency`` webhooks to an upstream that takes ``delay_ms`` each.
+
+    ``sync`` is what one sync worker can do (requests, one call at a time);
+    ``async`` is one event loop with aiohttp, as the async contact view does.
+    Entries are never saved, so no database is needed.
+    """
+    import aiohttp
+
+    def entries():
+        return [WebhookOutbox(payload={"full_name": f"Load {index}"}) for index in range(concurrency)]
+
+    async def deliver_all(batch):
+        async with aiohttp.ClientSession() as session:
+            return await asyncio.gather(*(adeliver(entry, session) for entry in batch))
+
+    results = {}
+    with slow_upstream(delay_ms / 1000) as url, override_settings(MAKE_WEBHOOK_URL=url):
+        session = build_session()
+        started = time.perf_counter()
+        delivered = [deliver(entry, session) for entry in entries()]
+        results["sync"] = (sum(delivered), time.perf_counter() - started)
+        session.close()
+
+        started = time.perf_counter()
+        delivered = asyncio.run(deliver_all(entries()))
+        results["async"] = (sum(delivered), time.perf_counter() - started)
+
+    return {
+        mode: {"delivered": count, "wall_s": elapsed, "per_s": count / elapsed if elapsed else 0.0}
+        for mode, (count, elapsed) in results.items()
+    }
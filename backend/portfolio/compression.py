@@ -0,0 +1,69 @@
+import gzip
+
+from django.conf import settings
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+
+def available_encodings():
+    """Supported content codings in server preference order."""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def min_size():
+    return getattr(settings, "API_COMPRESSION_MIN_SIZE", 1024)
+
+
+def negotiate(accept_encoding):
+    """Pick the preferred encoding the client accepts, or None for identity."""
+    accepted = {}
+    for part in (accept_encoding or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[coding] = quality
+
+    candidates = [
+        encoding
+        for encoding in available_encodings()
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0
+    ]
+    if not candidates:
+        return None
+    return max(candidates, key=lambda encoding: accepted.get(encoding, accepted.get("*", 0.0)))
+
+
+def compress(body, encoding):
+    if encoding == "br":
+        return brotli.compress(body, quality=getattr(settings, "API_BROTLI_QUALITY", 5))
+    if encoding == "gzip":
+        # mtime=0 keeps the output byte-identical for identical input.
+        return gzip.compress(body, compresslevel=getattr(settings, "API_GZIP_LEVEL", 6), mtime=0)
+    raise ValueError(f"Unsupported encoding: {encoding}")
+
+
+def encoded_etag(etag, encoding):
+    """Give each encoding its own strong validator, as RFC 9110 requires."""
+    if not etag or not encoding:
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def apply_encoding(response, body, encoding):
+    response.content = body
+    response["Content-Encoding"] = encoding
+    response["Content-Length"] = str(len(body))
+    if response.has_header("ETag"):
+        response["ETag"] = encoded_etag(response["ETag"], encoding)
@@ -0,0 +1,310 @@
+"""JSON Lines import/export of portfolio content.
+
+Each line is ``{"model": "<label>", "fields": {...}}``, like a Django fixture
+entry. Fields that ``save()`` derives (rendered HTML, hashes, read time,
+search vectors, image variants) are never exported; imports recompute them.
+"""
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from django.db import connection, models, transaction
+from django.utils import timezone
+from django.utils.text import slugify
+
+from .models import (
+    BLOG_SEARCH_VECTOR,
+    PROJECT_SEARCH_VECTOR,
+    Blog,
+    ContactMessage,
+    Education,
+    Experience,
+    Project,
+    Skill,
+)
+from .rendering import content_hash, read_time_for, render_description
+from .response_cache import bump_version
+from .responses import dumps
+from .signals import CACHE_NAMESPACES
+
+# Label -> model, in dependency-free export order.
+CONTENT_MODELS = {
+    "project": Project,
+    "blog": Blog,
+    "skill": Skill,
+    "experience": Experience,
+    "education": Education,
+    "contact_message": ContactMessage,
+}
+DERIVED_FIELDS = {
+    "description_html",
+    "description_hash",
+    "story_html",
+    "story_hash",
+    "read_time",
+    "search_vector",
+    "image_variants",
+}
+# Rows are upserted on these columns. Models without a natural key upsert on
+# ``id`` when the line carries one and insert otherwise.
+UPSERT_KEYS = {Project: "slug", Blog: "slug", Skill: "name"}
+SEARCH_VECTORS = {Project: PROJECT_SEARCH_VECTOR, Blog: BLOG_SEARCH_VECTOR}
+# model -> (markdown source, rendered HTML, content hash) fields.
+RENDERED_FIELDS = {
+    Project: ("description", "description_html", "description_hash"),
+    Blog: ("story", "story_html", "story_hash"),
+}
+# Below this many distinct texts a process pool costs more than it saves.
+POOL_THRESHOLD = 200
+
+
+class ContentError(ValueError):
+    pass
+
+
+@dataclass
+class ImportResult:
+    model: type
+    rows: int
+
+
+def content_fields(model):
+    return [field for field in model._meta.concrete_fields if field.name not in DERIVED_FIELDS]
+
+
+def export_lines(labels=None, chunk_size=2000):
+    """Yield one encoded JSON line (bytes, no newline) per row."""
+    for label in labels or CONTENT_MODELS:
+        model = CONTENT_MODELS[label]
+        names = [field.name for field in content_fields(model)]
+        rows = model.objects.order_by("pk").values_list(*names)
+        for row in rows.iterator(chunk_size=chunk_size):
+            yield dumps({"model": label, "fields": dict(zip(names, row))}, exact_times=True)
+
+
+def _auto_timestamp_fields(model):
+    return [
+        field
+        for field in model._meta.concrete_fields
+        if isinstance(field, models.DateField) and (field.auto_now or field.auto_now_add)
+    ]
+
+
+@contextmanager
+def _explicit_timestamps(model):
+    """Let imported ``created_at``/``updated_at`` values through ``bulk_create``.
+
+    Yields ``(field, was_auto_now_add)`` pairs for the disabled fields.
+    """
+    fields = _auto_timestamp_fields(model)
+    saved = [(field, field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield [(field, auto_now_add) for field, _, auto_now_add in saved]
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+def _parse(model, data, line_number):
+    fields = {field.name: field for field in content_fields(model)}
+    unknown = set(data).difference(fields)
+    if unknown:
+        names = ", ".join(sorted(unknown))
+        raise ContentError(f"Line {line_number}: unknown {model.__name__} fields: {names}.")
+    try:
+        return {name: fields[name].to_python(value) for name, value in data.items()}
+    except Exception as exc:
+        raise ContentError(f"Line {line_number}: {exc}") from None
+
+
+def _unique_slugs(model, instances, seen):
+    """Fill blank slugs from titles, suffixing clashes with stored and imported slugs.
+
+    ``seen`` holds the slugs already used by this and earlier chunks.
+    Explicit slugs are kept as given, so they upsert onto existing rows;
+    generated ones never do.
+    """
+    for instance in instances:
+        if instance.slug:
+            seen.add(instance.slug)
+    bases = [(instance, slugify(instance.title) or "item") for instance in instances if not instance.slug]
+    if bases:
+        # Stored rows can only clash with a base or one of its suffixed forms.
+        candidates = {base for _, base in bases}
+        taken = set(model.objects.filter(slug__in=candidates).values_list("slug", flat=True))
+        if taken:
+            clashes = models.Q()
+            for base in taken:
+                clashes |= models.Q(slug__startswith=f"{base}-")
+            taken.update(model.objects.filter(clashes).values_list("slug", flat=True))
+        seen.update(taken)
+    for instance, base in bases:
+        slug, suffix = base, 2
+        while slug in seen:
+            slug = f"{base}-{suffix}"
+            suffix += 1
+        instance.slug = slug
+        seen.add(slug)
+
+
+def _free_ids(model, instances, key):
+    """Give a new ``id`` to rows whose imported one belongs to another row.
+
+    Rows upsert on ``key``, so an exported line whose row was since renamed
+    (or a line repeating another line's ``id``) would insert a duplicate
+    primary key. Such rows are inserted under a fresh ``id`` instead.
+    """
+    owners = dict(
+        model.objects.filter(pk__in=[instance.pk for instance in instances]).values_list("pk", key)
+    )
+    used = set()
+    for instance in instances:
+        owner = owners.get(instance.pk, getattr(instance, key))
+        if owner != getattr(instance, key) or instance.pk in used:
+            instance.pk = model._meta.pk.get_default()
+        used.add(instance.pk)
+
+
+def _render_markdown(model, instances, workers):
+    """Fill the rendered HTML fields, rendering each distinct text once.
+
+    Markdown dominates import time, so large imports render across a
+    process pool.
+    """
+    source, html_field, hash_field = RENDERED_FIELDS[model]
+    texts = list(dict.fromkeys(getattr(instance, source) for instance in instances))
+    if workers > 1 and len(texts) >= POOL_THRESHOLD:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            rendered = dict(zip(texts, pool.map(render_description, texts, chunksize=64)))
+    else:
+        rendered = {text: render_description(text) for text in texts}
+    for instance in instances:
+        text = getattr(instance, source)
+        setattr(instance, html_field, rendered[text])
+        setattr(instance, hash_field, content_hash(text))
+        if model is Blog:
+            instance.read_time = read_time_for(text)
+            instance.refresh_date_label()
+
+
+def _copy_upsert(model, instances, key, update_fields):
+    """Upsert through ``COPY`` into a temporary table and one ``INSERT ... SELECT``.
+
+    For large chunks this is several times faster than ``bulk_create``, whose
+    cost is mostly building and parsing one huge parameterised statement.
+    """
+    quote = connection.ops.quote_name
+    fields = [field for field in model._meta.concrete_fields if field.name != "search_vector"]
+    table = quote(model._meta.db_table)
+    staging = quote(f"import_{model._meta.db_table}")
+    columns = ", ".join(quote(field.column) for field in fields)
+    updates = ", ".join(
+        f"{quote(field.column)} = EXCLUDED.{quote(field.column)}" for field in fields if field.name in update_fields
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TEMPORARY TABLE {staging} ON COMMIT DROP AS SELECT {columns} FROM {table} WITH NO DATA"
+        )
+        # psycopg adapts every other column type natively; JSON needs Django's wrapper.
+        json_columns = [index for index, field in enumerate(fields) if isinstance(field, models.JSONField)]
+        attnames = [field.attname for field in fields]
+        with cursor.copy(f"COPY {staging} ({columns}) FROM STDIN") as copy:
+            for instance in instances:
+                row = [getattr(instance, attname) for attname in attnames]
+                for index in json_columns:
+                    row[index] = fields[index].get_db_prep_save(row[index], connection)
+                copy.write_row(row)
+        cursor.execute(
+            f"INSERT INTO {table} ({columns}) SELECT {columns} FROM {staging} "
+            f"ON CONFLICT ({quote(model._meta.get_field(key).column)}) DO UPDATE SET {updates}"
+        )
+        cursor.execute(f"DROP TABLE {staging}")
+
+
+def _upsert(model, instances, provided, timestamp_fields, batch_size):
+    now = timezone.now()
+    skipped = {"search_vector"}
+    for field, auto_now_add in timestamp_fields:
+        for instance in instances:
+            if field.name not in instance._imported:
+                setattr(instance, field.attname, now)
+        if auto_now_add and field.name not in provided:
+            # Keep the stored creation time of existing rows unless every line sets it.
+            skipped.add(field.name)
+
+    key = UPSERT_KEYS.get(model, "id")
+    update_fields = [
+        field.name
+        for field in model._meta.concrete_fields
+        if not field.primary_key and field.name != key and field.name not in skipped
+    ]
+    if key == "id":
+        # Small tables without a natural key; rows may omit ``id`` entirely.
+        model.objects.bulk_create(
+            instances,
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=[key],
+            update_fields=update_fields,
+        )
+    else:
+        _free_ids(model, instances, key)
+        _copy_upsert(model, instances, key, update_fields)
+
+    vector = SEARCH_VECTORS.get(model)
+    if vector is not None:
+        model.objects.filter(slug__in=[instance.slug for instance in instances]).update(search_vector=vector)
+
+
+def import_lines(lines, batch_size=5000, workers=None):
+    """Upsert JSON ``lines`` in chunks and return one ``ImportResult`` per model.
+
+    Runs in a single transaction; a bad line aborts the whole import.
+    """
+    pending = {model: [] for model in CONTENT_MODELS.values()}
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            entry = json.loads(line)
+            model = CONTENT_MODELS[entry["model"]]
+            data = entry["fields"]
+        except (ValueError, KeyError, TypeError):
+            raise ContentError(
+                f'Line {line_number}: expected {{"model": <label>, "fields": {{...}}}}.'
+            ) from None
+        pending[model].append((line_number, data))
+
+    results = []
+    with transaction.atomic():
+        for model, entries in pending.items():
+            if not entries:
+                continue
+            key = UPSERT_KEYS.get(model, "id")
+            seen_slugs = set()
+            with _explicit_timestamps(model) as timestamp_fields:
+                for start in range(0, len(entries), batch_size):
+                    chunk = entries[start:start + batch_size]
+                    instances = []
+                    provided = None
+                    for line_number, data in chunk:
+                        instance = model(**_parse(model, data, line_number))
+                        instance._imported = set(data)
+                        provided = set(data) if provided is None else provided & set(data)
+                        instances.append(instance)
+                    if key == "slug":
+                        _unique_slugs(model, instances, seen_slugs)
+                    # One statement cannot update a row twice; the last line wins.
+                    instances = list({getattr(instance, key): instance for instance in instances}.values())
+                    if model in RENDERED_FIELDS:
+                        _render_markdown(model, instances, workers or os.cpu_count() or 1)
+                    _upsert(model, instances, provided, timestamp_fields, batch_size)
+            results.append(ImportResult(model, len(entries)))
+            if model in CACHE_NAMESPACES:
+                # bulk_create sends no signals, so invalidate cached responses here.
+                transaction.on_commit(lambda namespace=CACHE_NAMESPACES[model]: bump_version(namespace))
+    return results
@@ -0,0 +1,167 @@
+import base64
+import hashlib
+import io
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit
+
+from django.conf import settings
+from django.http.request import validate_host
+
+logger = logging.getLogger(__name__)
+
+MIME_TYPES = {"avif": "image/avif", "webp": "image/webp"}
+PLACEHOLDER_WIDTH = 16
+VARIANTS_DIR = "variants"
+
+
+def variant_formats():
+    """Output formats in ``<picture>`` preference order; AVIF only if Pillow can write it."""
+    from PIL import features
+
+    try:
+        avif = features.check("avif")
+    except ValueError:  # Pillow < 11.2 does not know the feature name.
+        avif = False
+    return ("avif", "webp") if avif else ("webp",)
+
+
+@dataclass(frozen=True)
+class ImageJob:
+    """Everything ``process_image`` needs, so it can run in a worker process."""
+
+    url: str
+    source: str
+    signature: str
+    output_dir: str
+    output_url: str
+    widths: tuple
+    formats: tuple
+    quality: int
+
+
+def _signature(path):
+    stat = os.stat(path)
+    return f"{stat.st_size}-{stat.st_mtime_ns}"
+
+
+def image_job(url):
+    """Return an ``ImageJob`` for ``url`` if it points at a file under MEDIA_ROOT.
+
+    Remote images are never fetched; they are served as-is.
+    """
+    parts = urlsplit(url or "")
+    media_url = settings.MEDIA_URL
+    if not parts.path.startswith(media_url):
+        return None
+    if parts.netloc and not validate_host(parts.netloc.split(":")[0], settings.ALLOWED_HOSTS):
+        return None
+
+    media_root = Path(settings.MEDIA_ROOT).resolve()
+    source = (media_root / parts.path[len(media_url):]).resolve()
+    if media_root not in source.parents or not source.is_file():
+        return None
+
+    signature = _signature(source)
+    digest = hashlib.sha1(f"{parts.path}|{signature}".encode("utf-8")).hexdigest()[:16]
+    output_path = f"{media_url}{VARIANTS_DIR}/{digest}/"
+    return ImageJob(
+        url=url,
+        source=str(source),
+        signature=signature,
+        output_dir=str(media_root / VARIANTS_DIR / digest),
+        output_url=urlunsplit((parts.scheme, parts.netloc, output_path, "", "")),
+        widths=tuple(getattr(settings, "IMAGE_VARIANT_WIDTHS", (320, 640, 960, 1280))),
+        formats=variant_formats(),
+        quality=getattr(settings, "IMAGE_VARIANT_QUALITY", 70),
+    )
+
+
+def _placeholder(image):
+    from PIL import ImageFilter
+
+    height = max(1, round(image.height * PLACEHOLDER_WIDTH / image.width))
+    small = image.resize((PLACEHOLDER_WIDTH, height)).filter(ImageFilter.GaussianBlur(1))
+    buffer = io.BytesIO()
+    small.save(buffer, "WEBP", quality=30)
+    return "data:image/webp;base64," + base64.b64encode(buffer.getvalue()).decode("ascii")
+
+
+def process_image(job):
+    """Write the width/format variants for ``job`` and return their description.
+
+    Uses no Django state, so it is safe to run in a process pool. Files are
+    named by content signature, so existing variants are reused.
+    """
+    # Pillow is only needed when images change; keep it out of cold start.
+    from PIL import Image, ImageOps
+
+    with Image.open(job.source) as original:
+        image = ImageOps.exif_transpose(original)
+        image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+
+    widths = [width for width in job.widths if width < image.width] + [image.width]
+    os.makedirs(job.output_dir, exist_ok=True)
+    sources = []
+    for fmt in job.formats:
+        srcset = []
+        for width in widths:
+            name = f"{width}.{fmt}"
+            path = os.path.join(job.output_dir, name)
+            if not os.path.exists(path):
+                height = max(1, round(image.height * width / image.width))
+                resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+                resized.save(path, fmt.upper(), quality=job.quality)
+            srcset.append(f"{job.output_url}{name} {width}w")
+        sources.append({"type": MIME_TYPES[fmt], "srcset": ", ".join(srcset)})
+
+    return {
+        "width": image.width,
+        "height": image.height,
+        "placeholder": _placeholder(image),
+        "sources": sources,
+        "signature": job.signature,
+    }
+
+
+def pending_jobs(instance, force=False):
+    """Jobs for the local images of ``instance`` whose variants are missing or stale."""
+    jobs = []
+    for url in dict.fromkeys([instance.image_url, *instance.images]):
+        job = image_job(url)
+        if job is None:
+            continue
+        current = instance.image_variants.get(url)
+        if force or not current or current.get("signature") != job.signature:
+            jobs.append(job)
+    return jobs
+
+
+def apply_variants(instance, results):
+    """Store ``results`` (url -> description) on ``instance`` and drop unused entries.
+
+    Returns True when ``image_variants`` changed.
+    """
+    urls = {instance.image_url, *instance.images}
+    variants = {url: value for url, value in instance.image_variants.items() if url in urls}
+    variants.update(results)
+    if variants == instance.image_variants:
+        return False
+    instance.image_variants = variants
+    return True
+
+
+def refresh_image_variants(instance, force=False):
+    """Generate missing variants for ``instance`` in-process; used by ``save()``.
+
+    Failures are logged and skipped so a bad upload never blocks saving.
+    """
+    results = {}
+    for job in pending_jobs(instance, force=force):
+        try:
+            results[job.url] = process_image(job)
+        except Exception as e:
+            logger.error("Error generating variants for %s: %s", job.url, e, exc_info=True)
+    return apply_variants(instance, results)
@@ -0,0 +1,89 @@
+import hashlib
+import re
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .projections import BLOG_SCHEMA, PROJECT_SCHEMA
+from .response_cache import get_versions
+from .responses import dumps
+from .views import build_bootstrap_payload
+
+INITIAL_DATA_KEY_PREFIX = "api:initial:"
+SCRIPT_ID = "initial-data"
+
+# HTML-significant characters are escaped so the payload cannot close the
+# <script> element; JSON.parse turns them back into the original text.
+_JSON_SCRIPT_ESCAPES = ((b"<", b"\\u003c"), (b">", b"\\u003e"), (b"&", b"\\u0026"))
+
+
+def _detail(schema, key):
+    def build(slug):
+        selection = schema.select(schema.model.objects.filter(slug=slug), schema.fields)
+        row = selection.queryset.first()
+        return {key: selection.encode(row)} if row is not None else None
+
+    return build
+
+
+# SPA route -> (cache namespaces, builder). Builders take the route's named
+# groups and return the data to embed, or None to embed nothing.
+ROUTES = (
+    (re.compile(r"^/$"), ("projects", "blogs", "skills", "education"), build_bootstrap_payload),
+    (
+        re.compile(r"^/projects/(?P<slug>[-\w]+)/?$"),
+        ("projects",),
+        _detail(PROJECT_SCHEMA, "project"),
+    ),
+    (
+        re.compile(r"^/blogs/(?P<slug>[-\w]+)/?$"),
+        ("blogs",),
+        _detail(BLOG_SCHEMA, "blog"),
+    ),
+)
+
+
+def _script(path, data):
+    body = dumps({"path": path, "data": data})
+    for char, escaped in _JSON_SCRIPT_ESCAPES:
+        body = body.replace(char, escaped)
+    return b'<script id="' + SCRIPT_ID.encode() + b'" type="application/json">' + body + b"</script>"
+
+
+def initial_data_script(path):
+    """Return the ``<script>`` tag to embed for ``path``, or ``b""``.
+
+    Tags are cached per route under the same version tokens as the API
+    responses, so content changes invalidate them too. Misses are not
+    cached, so probing random slugs cannot fill the cache.
+    """
+    for pattern, namespaces, builder in ROUTES:
+        match = pattern.match(path)
+        if match is not None:
+            break
+    else:
+        return b""
+
+    enabled = getattr(settings, "API_CACHE_ENABLED", True)
+    raw = f"{path}|{':'.join(get_versions(namespaces))}"
+    key = INITIAL_DATA_KEY_PREFIX + hashlib.sha1(raw.encode("utf-8")).hexdigest()
+    script = cache.get(key) if enabled else None
+    if script is None:
+        data = builder(**match.groupdict())
+        if data is None:
+            return b""
+        script = _script(path, data)
+        if enabled:
+            cache.set(key, script, timeout=getattr(settings, "API_CACHE_TIMEOUT", None))
+    return script
+
+
+def embed(html, script):
+    """Insert ``script`` just before ``</head>`` (or ``</body>``) of ``html``."""
+    if not script:
+        return html
+    for marker in (b"</head>", b"</body>"):
+        index = html.find(marker)
+        if index != -1:
+            return html[:index] + script + html[index:]
+    return html + script
@@ -0,0 +1,326 @@
+import copy
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+
+from django.conf import settings
+
+try:
+    import fcntl
+except ImportError:  # Windows: no compaction, see collect().
+    fcntl = None
+
+# Request latency buckets in seconds (Prometheus convention).
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+# Per-request timers reported in Server-Timing, in header order.
+TIMERS = ("db", "cache", "markdown", "json")
+
+_current = ContextVar("portfolio_request_metrics", default=None)
+
+logger = logging.getLogger(__name__)
+
+
+class RequestMetrics:
+    """Counters and timers for one request, reachable from anywhere via ``current()``."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.db_queries = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.durations = dict.fromkeys(TIMERS, 0.0)
+
+    def server_timing(self, total):
+        parts = [
+            f'db;dur={self.durations["db"] * 1000:.2f};desc="{self.db_queries} queries"',
+            f'cache;dur={self.durations["cache"] * 1000:.2f};'
+            f'desc="{self.cache_hits} hit, {self.cache_misses} miss"',
+            f'markdown;dur={self.durations["markdown"] * 1000:.2f}',
+            f'json;dur={self.durations["json"] * 1000:.2f}',
+            f"total;dur={total * 1000:.2f}",
+        ]
+        return ", ".join(parts)
+
+
+def current():
+    return _current.get()
+
+
+def start_request():
+    metrics = RequestMetrics()
+    return metrics, _current.set(metrics)
+
+
+def end_request(token):
+    _current.reset(token)
+
+
+@contextmanager
+def timed(name):
+    """Add the wall time of the block to timer ``name`` of the current request."""
+    metrics = _current.get()
+    if metrics is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.durations[name] += time.perf_counter() - started
+
+
+def count_cache(outcome):
+    metrics = _current.get()
+    if metrics is not None:
+        if outcome == "hits":
+            metrics.cache_hits += 1
+        else:
+            metrics.cache_misses += 1
+
+
+def db_wrapper(execute, sql, params, many, context):
+    """``connection.execute_wrapper`` hook counting and timing queries."""
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.durations["db"] += time.perf_counter() - started
+        metrics.db_queries += 1
+
+
+def install_db_wrapper(sender, connection, **kwargs):
+    """``connection_created`` receiver that keeps ``db_wrapper`` on every connection.
+
+    ``db_wrapper`` only counts while a request is measured, so it stays
+    installed; under ASGI, queries run in ``sync_to_async`` threads that a
+    per-request ``execute_wrapper`` block would not reach.
+    """
+    if db_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.append(db_wrapper)
+
+
+# ── Per-process aggregation ──────────────────────────────────────────────────
+
+def metrics_dir():
+    return Path(getattr(settings, "METRICS_DIR", Path(tempfile.gettempdir()) / "portfolio-metrics"))
+
+
+class ProcessStore:
+    """Per-view totals for this process, periodically written to ``METRICS_DIR``.
+
+    Every gunicorn worker writes its own ``<pid>-<start>.json``; ``/metrics``
+    sums all files, so totals cover every worker. The start time keeps a
+    reused pid from overwriting an exited worker's file.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Serialises writes of this process's file; recording never waits on it.
+        self._flush_lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self.pid = os.getpid()
+        self.filename = f"{self.pid}-{time.time_ns()}.json"
+        self.views = {}
+        self.last_flush = 0.0
+
+    def reset(self):
+        """Drop totals inherited from a parent process (gunicorn ``post_fork``)."""
+        with self._lock:
+            self._reset()
+
+    def record(self, view, elapsed, metrics):
+        with self._lock:
+            if os.getpid() != self.pid:
+                # Forked from a parent that had recorded requests; start clean.
+                self._reset()
+            stats = self.views.get(view)
+            if stats is None:
+                stats = self.views[view] = {
+                    "count": 0,
+                    "sum": 0.0,
+                    "buckets": [0] * len(LATENCY_BUCKETS),
+                    "db_queries": 0,
+                    "db_seconds": 0.0,
+                    "cache_hits": 0,
+                    "cache_misses": 0,
+                    "markdown_seconds": 0.0,
+                    "json_seconds": 0.0,
+                }
+            stats["count"] += 1
+            stats["sum"] += elapsed
+            for index, bound in enumerate(LATENCY_BUCKETS):
+                if elapsed <= bound:
+                    stats["buckets"][index] += 1
+            stats["db_queries"] += metrics.db_queries
+            stats["db_seconds"] += metrics.durations["db"]
+            stats["cache_hits"] += metrics.cache_hits
+            stats["cache_misses"] += metrics.cache_misses
+            stats["markdown_seconds"] += metrics.durations["markdown"]
+            stats["json_seconds"] += metrics.durations["json"]
+            due = time.monotonic() - self.last_flush >= getattr(settings, "METRICS_FLUSH_INTERVAL", 5)
+        if due:
+            try:
+                # Skipped while another thread writes; the next flush catches up.
+                self.flush(blocking=False)
+            except Exception:
+                # Metrics must never fail the request they measure.
+                logger.warning("Could not write request metrics", exc_info=True)
+
+    def flush(self, blocking=True):
+        if not self._flush_lock.acquire(blocking=blocking):
+            return
+        try:
+            with self._lock:
+                if os.getpid() != self.pid:
+                    self._reset()
+                snapshot = json.dumps(self.views)
+                filename = self.filename
+                self.last_flush = time.monotonic()
+            directory = metrics_dir()
+            directory.mkdir(parents=True, exist_ok=True)
+            staging = directory / f".{filename}.tmp"
+            staging.write_text(snapshot)
+            os.replace(staging, directory / filename)
+        finally:
+            self._flush_lock.release()
+
+
+store = ProcessStore()
+
+# Totals of exited workers, folded in by collect(): {"files": [...], "views": {...}}.
+RETIRED_FILE = "retired.json"
+
+
+def _read(path, default):
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return default
+
+
+def _merge(totals, views):
+    for view, stats in views.items():
+        merged = totals.get(view)
+        if merged is None:
+            totals[view] = copy.deepcopy(stats)
+            continue
+        for key, value in stats.items():
+            if key == "buckets":
+                merged[key] = [a + b for a, b in zip(merged[key], value)]
+            else:
+                merged[key] += value
+
+
+def _running(path):
+    try:
+        os.kill(int(path.stem.split("-")[0]), 0)
+    except ValueError:
+        return True  # Not a worker file; leave it alone.
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _worker_files(directory):
+    return [path for path in directory.glob("*.json") if path.name != RETIRED_FILE]
+
+
+def _compact(directory):
+    """Fold the files of exited workers into ``RETIRED_FILE`` and delete them.
+
+    Returns the retired totals and the files still being written. Folded file
+    names are recorded, so a crash between the write and the deletes cannot
+    count a file twice.
+    """
+    worker_files = _worker_files(directory)
+    retired = _read(directory / RETIRED_FILE, {"files": [], "views": {}})
+    folded = set(retired["files"])
+    live, dead = [], []
+    for path in worker_files:
+        (live if _running(path) else dead).append(path)
+    if dead:
+        for path in dead:
+            if path.name not in folded:
+                _merge(retired["views"], _read(path, {}))
+                folded.add(path.name)
+        # Names of files already deleted can never come back (start times differ).
+        present = {path.name for path in worker_files}
+        retired["files"] = sorted(folded & present)
+        staging = directory / f".{RETIRED_FILE}.tmp"
+        staging.write_text(json.dumps(retired))
+        os.replace(staging, directory / RETIRED_FILE)
+        for path in dead:
+            path.unlink(missing_ok=True)
+            (directory / f".{path.name}.tmp").unlink(missing_ok=True)
+    return retired["views"], live
+
+
+def collect():
+    """Sum the per-view totals written by every process, live or exited."""
+    directory = metrics_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    if fcntl is None:
+        totals = {}
+        for path in _worker_files(directory):
+            _merge(totals, _read(path, {}))
+        return totals
+
+    # Scrapes from different workers must not fold the same file twice, nor
+    # read a file and the retired totals it was just folded into.
+    with open(directory / ".lock", "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        retired, live = _compact(directory)
+        totals = copy.deepcopy(retired)
+        for path in live:
+            _merge(totals, _read(path, {}))
+    return totals
+
+
+# (metric, stats key, help)
+_COUNTERS = (
+    ("portfolio_db_queries_total", "db_queries", "SQL queries executed."),
+    ("portfolio_db_seconds_total", "db_seconds", "Time spent in SQL queries."),
+    ("portfolio_cache_hits_total", "cache_hits", "Response cache hits."),
+    ("portfolio_cache_misses_total", "cache_misses", "Response cache misses."),
+    ("portfolio_markdown_seconds_total", "markdown_seconds", "Time spent rendering markdown."),
+    ("portfolio_json_encode_seconds_total", "json_seconds", "Time spent encoding JSON."),
+)
+
+
+def _label(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render_prometheus(totals):
+    """Render ``collect()`` output in the Prometheus text exposition format."""
+    lines = [
+        "# HELP portfolio_request_duration_seconds Request latency by URL name.",
+        "# TYPE portfolio_request_duration_seconds histogram",
+    ]
+    for view in sorted(totals):
+        stats = totals[view]
+        label = f'view="{_label(view)}"'
+        for bound, value in zip(LATENCY_BUCKETS, stats["buckets"]):
+            lines.append(f'portfolio_request_duration_seconds_bucket{{{label},le="{bound}"}} {value}')
+        lines.append(f'portfolio_request_duration_seconds_bucket{{{label},le="+Inf"}} {stats["count"]}')
+        lines.append(f"portfolio_request_duration_seconds_sum{{{label}}} {stats['sum']}")
+        lines.append(f"portfolio_request_duration_seconds_count{{{label}}} {stats['count']}")
+    for metric, key, help_text in _COUNTERS:
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} counter")
+        for view in sorted(totals):
+            lines.append(f'{metric}{{view="{_label(view)}"}} {totals[view][key]}')
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand
+
+from portfolio.models import Blog, Project
+from portfolio.response_cache import bump_version
+from portfolio.signals import CACHE_NAMESPACES
+
+# model -> (render method, source field, fields it writes)
+RENDERED_FIELDS = {
+    Project: ("refresh_description_html", "description", ["description_html", "description_hash"]),
+    Blog: ("refresh_story_html", "story", ["story_html", "story_hash", "read_time"]),
+}
+
+
+class Command(BaseCommand):
+    help = "Render and store description_html for projects and story_html for blogs whose content changed."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Re-render every record, even if its content hash is unchanged.",
+        )
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        for model, (method, source, fields) in RENDERED_FIELDS.items():
+            updated = self._backfill(model, method, source, fields, options["force"], options["batch_size"])
+            self.stdout.write(
+                self.style.SUCCESS(f"Updated {fields[0]} for {updated} {model._meta.verbose_name}(s).")
+            )
+            if updated:
+                # bulk_update sends no signals, so invalidate cached responses here.
+                bump_version(CACHE_NAMESPACES[model])
+
+    def _backfill(self, model, method, source, fields, force, batch_size):
+        pending = []
+        updated = 0
+
+        queryset = model.objects.only("id", source, *fields)
+        for instance in queryset.iterator(chunk_size=batch_size):
+            if getattr(instance, method)(force=force):
+                pending.append(instance)
+            if len(pending) >= batch_size:
+                model.objects.bulk_update(pending, fields)
+                updated += len(pending)
+                pending = []
+
+        if pending:
+            model.objects.bulk_update(pending, fields)
+            updated += len(pending)
+        return updated
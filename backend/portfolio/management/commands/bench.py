@@ -0,0 +1,115 @@
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import override_settings, setup_test_environment, teardown_test_environment
+from django.utils import timezone
+
+from portfolio.benchmarks import BenchmarkError, compare_results, run_benchmarks, run_upstream_benchmark
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a throwaway test database at several dataset sizes and report latency percentiles, "
+        "SQL query count, DB time and peak memory for every read endpoint."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", default="100,10000", help="Comma-separated row counts per table.")
+        parser.add_argument("--repeat", type=int, default=20, help="Timed requests per endpoint.")
+        parser.add_argument(
+            "--cache",
+            action="store_true",
+            help="Keep the response cache on (measures hits instead of view and query work).",
+        )
+        parser.add_argument("--output", help="Write results as JSON to this file.")
+        parser.add_argument("--compare", help="Baseline JSON from an earlier --output run.")
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=0.2,
+            help="Allowed p95 growth over the baseline as a fraction (default 0.2 = 20%%).",
+        )
+        parser.add_argument(
+            "--min-delta-ms",
+            type=float,
+            default=1.0,
+            help="Ignore p95 changes smaller than this many milliseconds.",
+        )
+        parser.add_argument(
+            "--keepdb",
+            action="store_true",
+            help="Reuse the test database between runs instead of recreating it.",
+        )
+
+        parser.add_argument(
+            "--slow-upstream",
+            action="store_true",
+            help="Instead of the endpoint sweep, compare sync and async webhook delivery "
+            "against a local upstream that answers slowly.",
+        )
+        parser.add_argument("--concurrency", type=int, default=50, help="Deliveries for --slow-upstream.")
+        parser.add_argument(
+            "--upstream-delay-ms", type=int, default=200, help="Upstream response time for --slow-upstream."
+        )
+
+    def handle(self, *args, **options):
+        if options["slow_upstream"]:
+            self.run_slow_upstream(options["concurrency"], options["upstream_delay_ms"])
+            return
+
+        sizes = [int(value) for value in options["sizes"].split(",")]
+        baseline = None
+        if options["compare"]:
+            baseline = json.loads(Path(options["compare"]).read_text())["results"]
+
+        self.stdout.write(
+            f"{'size':>7} {'endpoint':<18} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+            f"{'queries':>7} {'db ms':>7} {'peak KiB':>9}"
+        )
+
+        def log(size, name, stats):
+            self.stdout.write(
+                f"{size:>7} {name:<18} {stats['p50_ms']:>8.2f} {stats['p95_ms']:>8.2f} "
+                f"{stats['p99_ms']:>8.2f} {stats['queries']:>7} {stats['db_ms']:>7.2f} {stats['peak_kib']:>9.1f}"
+            )
+
+        old_name = connection.settings_dict["NAME"]
+        setup_test_environment()
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=options["keepdb"])
+        try:
+            with override_settings(API_CACHE_ENABLED=options["cache"], API_SNAPSHOT_MODE=False):
+                results = run_benchmarks(sizes, options["repeat"], log=log)
+        except BenchmarkError as exc:
+            raise CommandError(str(exc)) from None
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=options["keepdb"])
+            teardown_test_environment()
+
+        if options["output"]:
+            report = {
+                "generated_at": timezone.now().isoformat(),
+                "repeat": options["repeat"],
+                "cache": options["cache"],
+                "results": results,
+            }
+            Path(options["output"]).write_text(json.dumps(report, indent=2))
+            self.stdout.write(f"Wrote {options['output']}")
+
+        if baseline is not None:
+            regressions = compare_results(
+                baseline, results, options["threshold"], min_delta_ms=options["min_delta_ms"]
+            )
+            if regressions:
+                raise CommandError("Performance regressions:\n  " + "\n  ".join(regressions))
+            self.stdout.write(self.style.SUCCESS("No regressions against the baseline."))
+
+    def run_slow_upstream(self, concurrency, delay_ms):
+        results = run_upstream_benchmark(concurrency, delay_ms)
+        self.stdout.write(f"{concurrency} deliveries, upstream answers in {delay_ms} ms")
+        self.stdout.write(f"{'mode':<6} {'delivered':>9} {'wall s':>8} {'per s':>8}")
+        for mode, stats in results.items():
+            self.stdout.write(
+                f"{mode:<6} {stats['delivered']:>9} {stats['wall_s']:>8.2f} {stats['per_s']:>8.1f}"
+            )
@@ -0,0 +1,36 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from portfolio.benchmarks import synthetic_projects
+from portfolio.compression import available_encodings, compress
+from portfolio.responses import dumps
+
+
+class Command(BaseCommand):
+    help = "Measure size and CPU cost of gzip/brotli on project_list-shaped JSON payloads."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--items", default="10,100,1000", help="Comma-separated payload sizes.")
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, **options):
+        sizes = [int(value) for value in options["items"].split(",")]
+        repeat = options["repeat"]
+        self.stdout.write(f"{'items':>6} {'encoding':>8} {'bytes':>10} {'ratio':>7} {'ms/op':>8}")
+        for count in sizes:
+            body = dumps(synthetic_projects(count))
+            self.stdout.write(f"{count:>6} {'identity':>8} {len(body):>10} {1:>7.2f} {0:>8.3f}")
+            for encoding in available_encodings():
+                started = time.perf_counter()
+                for _ in range(repeat):
+                    compressed = compress(body, encoding)
+                elapsed_ms = (time.perf_counter() - started) * 1000 / repeat
+                ratio = len(compressed) / len(body)
+                self.stdout.write(
+                    f"{count:>6} {encoding:>8} {len(compressed):>10} {ratio:>7.2f} {elapsed_ms:>8.3f}"
+                )
+        self.stdout.write(
+            "Cached responses pay the ms/op cost once per content version; "
+            "uncached responses pay it on every request."
+        )
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+
+from portfolio import responses
+from portfolio.benchmarks import summarize, synthetic_projects, time_call
+
+
+class Command(BaseCommand):
+    help = "Compare orjson and the stdlib fallback encoding project_list-shaped payloads."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--items", default="1000,10000", help="Comma-separated payload sizes.")
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, **options):
+        encoders = {"stdlib": lambda data: responses._fallback_encoder.encode(data).encode("utf-8")}
+        if responses.orjson is not None:
+            encoders["orjson"] = lambda data: responses.orjson.dumps(
+                data, default=responses._orjson_default, option=responses.ORJSON_OPTIONS
+            )
+        else:
+            self.stdout.write(self.style.WARNING("orjson is not installed; only the fallback is measured."))
+
+        self.stdout.write(f"{'items':>6} {'encoder':>8} {'bytes':>10} {'p50 ms':>9} {'p95 ms':>9}")
+        for count in [int(value) for value in options["items"].split(",")]:
+            payload = synthetic_projects(count)
+            results = {}
+            for name, encode in encoders.items():
+                body = encode(payload)
+                stats = summarize(time_call(lambda: encode(payload), options["repeat"]))
+                results[name] = stats["p50_ms"]
+                self.stdout.write(
+                    f"{count:>6} {name:>8} {len(body):>10} {stats['p50_ms']:>9.3f} {stats['p95_ms']:>9.3f}"
+                )
+            if "orjson" in results and results["orjson"]:
+                self.stdout.write(f"{count:>6} speedup: {results['stdlib'] / results['orjson']:.1f}x")
@@ -0,0 +1,66 @@
+import json
+import shutil
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from portfolio.compression import available_encodings, compress
+from portfolio.models import Blog, Project
+from portfolio.response_cache import compute_etag
+from portfolio.snapshots import ENCODING_SUFFIXES, MANIFEST_NAME, snapshot_dir
+from portfolio.warmup import LIST_ENDPOINTS, call_view
+
+
+def snapshot_paths():
+    for name in LIST_ENDPOINTS:
+        yield reverse(name)
+    for slug in Project.objects.values_list("slug", flat=True):
+        yield reverse("project-detail", args=[slug])
+    for slug in Blog.objects.values_list("slug", flat=True):
+        yield reverse("blog-detail", args=[slug])
+
+
+def render(factory, path):
+    response = call_view(factory, path)
+    if response.status_code != 200:
+        raise CommandError(f"{path} returned HTTP {response.status_code}")
+    return response.content
+
+
+class Command(BaseCommand):
+    help = "Render every read endpoint to content-hashed JSON files under STATIC_ROOT."
+
+    def handle(self, *args, **options):
+        root = snapshot_dir()
+        staging = root.with_name(root.name + ".tmp")
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir(parents=True)
+
+        factory = RequestFactory()
+        prefix = reverse("bootstrap").removesuffix("bootstrap/")
+        entries = {}
+        with override_settings(API_CACHE_ENABLED=False, API_SNAPSHOT_MODE=False):
+            for path in snapshot_paths():
+                body = render(factory, path)
+                etag = compute_etag(body)
+                name = path.removeprefix(prefix).strip("/")
+                digest = etag.strip('"')[:12]
+                relative = f"{name}.{digest}.json"
+                target = staging / relative
+                target.parent.mkdir(parents=True, exist_ok=True)
+                target.write_bytes(body)
+                for encoding in available_encodings():
+                    target.with_name(target.name + ENCODING_SUFFIXES[encoding]).write_bytes(
+                        compress(body, encoding)
+                    )
+                entries[path] = {"file": relative, "etag": etag}
+
+        manifest = {"generated_at": int(time.time()), "entries": entries}
+        (staging / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2, sort_keys=True))
+
+        shutil.rmtree(root, ignore_errors=True)
+        staging.rename(root)
+        self.stdout.write(self.style.SUCCESS(f"Exported {len(entries)} endpoint(s) to {root}."))
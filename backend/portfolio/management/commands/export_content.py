@@ -0,0 +1,35 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from portfolio.content_io import CONTENT_MODELS, export_lines
+
+
+class Command(BaseCommand):
+    help = "Write portfolio content as JSON Lines (one {model, fields} object per row)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("output", nargs="?", default="-", help="File to write, or - for stdout.")
+        parser.add_argument(
+            "--models",
+            help=f"Comma-separated subset of: {', '.join(CONTENT_MODELS)}.",
+        )
+
+    def handle(self, *args, **options):
+        labels = None
+        if options["models"]:
+            labels = [label.strip() for label in options["models"].split(",") if label.strip()]
+            unknown = set(labels).difference(CONTENT_MODELS)
+            if unknown:
+                raise CommandError(f"Unknown models: {', '.join(sorted(unknown))}.")
+
+        count = 0
+        stream = sys.stdout.buffer if options["output"] == "-" else open(options["output"], "wb")
+        try:
+            for line in export_lines(labels):
+                stream.write(line + b"\n")
+                count += 1
+        finally:
+            if stream is not sys.stdout.buffer:
+                stream.close()
+        self.stderr.write(f"Exported {count} row(s).")
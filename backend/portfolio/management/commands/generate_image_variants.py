@@ -0,0 +1,65 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand
+
+from portfolio.images import apply_variants, pending_jobs, process_image
+from portfolio.models import Blog, Project
+from portfolio.response_cache import bump_version
+from portfolio.signals import CACHE_NAMESPACES
+
+
+class Command(BaseCommand):
+    help = "Generate WebP/AVIF width variants and placeholders for locally stored project and blog images."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Regenerate variants even when the source image is unchanged.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Worker processes to encode images with (default: one per CPU).",
+        )
+
+    def handle(self, *args, **options):
+        instances = []
+        jobs = {}
+        for model in (Project, Blog):
+            for instance in model.objects.only("id", "image_url", "images", "image_variants"):
+                instances.append(instance)
+                for job in pending_jobs(instance, force=options["force"]):
+                    jobs.setdefault(job.url, job)
+
+        results = {}
+        failed = 0
+        with ProcessPoolExecutor(max_workers=max(options["workers"], 1)) as pool:
+            futures = {url: pool.submit(process_image, job) for url, job in jobs.items()}
+            for url, future in futures.items():
+                try:
+                    results[url] = future.result()
+                except Exception as e:
+                    failed += 1
+                    self.stderr.write(f"Failed to process {url}: {e}")
+
+        changed = {Project: [], Blog: []}
+        for instance in instances:
+            urls = {instance.image_url, *instance.images}
+            if apply_variants(instance, {url: results[url] for url in urls if url in results}):
+                changed[type(instance)].append(instance)
+
+        for model, updated in changed.items():
+            if updated:
+                model.objects.bulk_update(updated, ["image_variants"], batch_size=500)
+                # bulk_update sends no signals, so invalidate cached responses here.
+                bump_version(CACHE_NAMESPACES[model])
+
+        total = sum(len(updated) for updated in changed.values())
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Processed {len(results)} image(s) ({failed} failed); updated {total} record(s)."
+            )
+        )
@@ -0,0 +1,39 @@
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from portfolio.content_io import ContentError, import_lines
+
+
+class Command(BaseCommand):
+    help = (
+        "Upsert portfolio content from JSON Lines written by export_content. Projects and blogs "
+        "upsert on slug (generated from the title when missing), skills on name, the rest on id."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("input", nargs="?", default="-", help="File to read, or - for stdin.")
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument(
+            "--workers",
+            type=int,
+            help="Processes used to render markdown (default: one per CPU).",
+        )
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        stream = sys.stdin if options["input"] == "-" else open(options["input"], encoding="utf-8")
+        try:
+            results = import_lines(stream, batch_size=options["batch_size"], workers=options["workers"])
+        except ContentError as exc:
+            raise CommandError(str(exc)) from None
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+        for result in results:
+            self.stdout.write(f"{result.model._meta.verbose_name_plural}: {result.rows} row(s)")
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f"Imported in {elapsed:.1f}s."))
+        self.stdout.write("Run generate_image_variants to process local images.")
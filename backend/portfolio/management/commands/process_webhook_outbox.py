@@ -0,0 +1,59 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import OperationalError, close_old_connections
+
+from portfolio.webhooks import build_session, process_due
+
+# Longest wait between retries while the database is unreachable.
+MAX_DB_BACKOFF = 60.0
+
+
+class Command(BaseCommand):
+    help = "Deliver queued Make.com webhook notifications with retries and backoff."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Drain the currently due entries and exit instead of polling.",
+        )
+        parser.add_argument("--batch-size", type=int, default=20)
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=5.0,
+            help="Seconds to sleep when the outbox has nothing due.",
+        )
+
+    def handle(self, *args, **options):
+        session = build_session()
+        batch_size = options["batch_size"]
+        backoff = options["poll_interval"]
+        try:
+            while True:
+                # Like the end of a request: drop connections that died (database
+                # restart, idle timeout) or outlived CONN_MAX_AGE.
+                close_old_connections()
+                try:
+                    attempted = process_due(session, batch_size=batch_size)
+                except OperationalError as exc:
+                    if options["once"]:
+                        raise
+                    self.stderr.write(f"Database unavailable ({exc}); retrying in {backoff:.0f}s.")
+                    time.sleep(backoff)
+                    backoff = min(backoff * 2, MAX_DB_BACKOFF)
+                    continue
+                backoff = options["poll_interval"]
+                if attempted:
+                    self.stdout.write(f"Attempted {attempted} webhook delivery(ies).")
+                if options["once"]:
+                    if attempted < batch_size:
+                        break
+                    continue
+                if attempted < batch_size:
+                    time.sleep(options["poll_interval"])
+        except KeyboardInterrupt:
+            pass
+        finally:
+            session.close()
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from portfolio.warmup import warm_up
+
+
+class Command(BaseCommand):
+    help = (
+        "Render the list endpoints and the home page's initial data into the response cache, "
+        "failing if any endpoint does not return 200. Run after deploy steps that change content."
+    )
+
+    def handle(self, *args, **options):
+        statuses = warm_up()
+        for path, status in statuses.items():
+            self.stdout.write(f"{status} {path}")
+        failed = [path for path, status in statuses.items() if status != 200]
+        if failed:
+            raise CommandError(f"Warm-up failed for: {', '.join(failed)}")
+        self.stdout.write(self.style.SUCCESS(f"Warmed {len(statuses)} endpoint(s)."))
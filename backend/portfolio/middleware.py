@@ -0,0 +1,120 @@
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.utils.cache import patch_vary_headers
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+from .compression import apply_encoding, compress, min_size, negotiate
+from .instrumentation import end_request, start_request, store
+
+
+class AsyncCapableMiddleware:
+    """Base for middleware that runs natively under both WSGI and ASGI.
+
+    Under ASGI, a single sync-only middleware makes Django run the whole
+    request through its one shared sync thread, so every middleware in the
+    stack must handle coroutine handlers. Subclasses implement ``process``,
+    called with the response of either handler.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self.process(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self.process(request, await self.get_response(request))
+
+    def process(self, request, response):
+        return response
+
+
+class StaticFilesMiddleware(WhiteNoiseMiddleware):
+    """WhiteNoise with a native async path (WhiteNoise 6 is sync-only)."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None, settings=None):
+        if settings is None:
+            super().__init__(get_response)
+        else:
+            super().__init__(get_response, settings)
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = await sync_to_async(self.find_file)(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return self.serve(static_file, request)
+        return await self.get_response(request)
+
+
+class ApiCompressionMiddleware(AsyncCapableMiddleware):
+    """Compress ``/api/`` responses that were not already encoded by the response cache."""
+
+    def process(self, request, response):
+        if not request.path.startswith("/api/"):
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        if (
+            response.streaming
+            or response.has_header("Content-Encoding")
+            or len(response.content) < min_size()
+        ):
+            return response
+
+        encoding = negotiate(request.META.get("HTTP_ACCEPT_ENCODING"))
+        if encoding is not None:
+            apply_encoding(response, compress(response.content, encoding), encoding)
+        return response
+
+
+class RequestMetricsMiddleware(AsyncCapableMiddleware):
+    """Time each request's DB, cache, markdown and JSON work.
+
+    Adds a ``Server-Timing`` header and feeds the per-URL-name totals served
+    at ``/metrics``.
+    """
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        metrics, token = start_request()
+        try:
+            response = self.get_response(request)
+        finally:
+            end_request(token)
+        return self.finish(request, response, metrics)
+
+    async def __acall__(self, request):
+        metrics, token = start_request()
+        try:
+            response = await self.get_response(request)
+        finally:
+            end_request(token)
+        return self.finish(request, response, metrics)
+
+    def finish(self, request, response, metrics):
+        elapsed = time.perf_counter() - metrics.started
+        response["Server-Timing"] = metrics.server_timing(elapsed)
+        match = request.resolver_match
+        store.record(match.url_name if match and match.url_name else "other", elapsed, metrics)
+        return response
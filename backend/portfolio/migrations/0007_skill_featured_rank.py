@@ -0,0 +1,33 @@
+# Generated by Django 5.1.1 on 2026-10-18 14:15
+
+from django.db import migrations, models
+
+
+# The names home_skill_list used to hard-code, in display order.
+PREVIOUSLY_PREFERRED = ["React", "Django", "Python", "PostgreSQL", "REST APIs"]
+
+
+def rank_preferred_skills(apps, schema_editor):
+    Skill = apps.get_model("portfolio", "Skill")
+    for rank, name in enumerate(PREVIOUSLY_PREFERRED, start=1):
+        Skill.objects.filter(name=name).update(featured_rank=rank)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0006_webhookoutbox'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='skill',
+            name='featured_rank',
+            field=models.PositiveSmallIntegerField(blank=True, db_index=True, help_text='Position on the homepage (1 is first). Leave blank to rank by proficiency.', null=True),
+        ),
+        migrations.AddIndex(
+            model_name='skill',
+            index=models.Index(fields=['-proficiency_level'], name='skill_proficiency_idx'),
+        ),
+        migrations.RunPython(rank_preferred_skills, migrations.RunPython.noop),
+    ]
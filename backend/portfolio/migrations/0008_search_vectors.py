@@ -0,0 +1,57 @@
+# Generated by Django 5.1.1 on 2026-10-18 14:16
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations, models
+
+
+def populate_search_vectors(apps, schema_editor):
+    def array_text(field):
+        return models.Func(
+            models.F(field), models.Value(" "), function="array_to_string", output_field=models.TextField()
+        )
+
+    Project = apps.get_model("portfolio", "Project")
+    Blog = apps.get_model("portfolio", "Blog")
+    Project.objects.update(
+        search_vector=SearchVector("title", weight="A", config="english")
+        + SearchVector("short_desc", weight="B", config="english")
+        + SearchVector(array_text("tech_stack"), weight="B", config="english")
+        + SearchVector("description", weight="C", config="english")
+    )
+    Blog.objects.update(
+        search_vector=SearchVector("title", weight="A", config="english")
+        + SearchVector("short_desc", weight="B", config="english")
+        + SearchVector(array_text("highlights"), weight="B", config="english")
+        + SearchVector("story", weight="C", config="english")
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0007_skill_featured_rank'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blog',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='blog',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='blog_search_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='project_search_idx'),
+        ),
+        migrations.RunPython(populate_search_vectors, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.1.1 on 2026-10-18 14:17
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0008_search_vectors'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['category'], name='project_category_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['tech_stack'], name='project_tech_stack_idx'),
+        ),
+    ]
@@ -0,0 +1,87 @@
+# Generated by Django 5.1.1 on 2026-10-18 14:25
+
+import re
+from datetime import datetime
+
+import django.utils.timezone
+from django.db import migrations, models
+
+# Formats seen in the free-form ``date`` field, most common first.
+DATE_FORMATS = (
+    "%B %d, %Y",
+    "%b %d, %Y",
+    "%B %d %Y",
+    "%b %d %Y",
+    "%d %B %Y",
+    "%d %b %Y",
+    "%Y-%m-%d",
+    "%d/%m/%Y",
+    "%m/%d/%Y",
+    "%B %Y",
+    "%b %Y",
+)
+
+
+def parse_display_date(value):
+    text = re.sub(r"\s+", " ", (value or "").strip())
+    text = re.sub(r"(\d)(st|nd|rd|th)\b", r"\1", text)
+    text = re.sub(r"\bSept\b", "Sep", text)
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+def set_published_on(apps, schema_editor):
+    Blog = apps.get_model("portfolio", "Blog")
+    blogs = list(Blog.objects.only("id", "date", "created_at"))
+    for blog in blogs:
+        # Unparseable labels fall back to when the post was created.
+        blog.published_on = parse_display_date(blog.date) or blog.created_at.date()
+    Blog.objects.bulk_update(blogs, ["published_on"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0010_image_variants'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='blog',
+            options={'ordering': ['-published_on', '-id']},
+        ),
+        migrations.AddField(
+            model_name='blog',
+            name='published_on',
+            field=models.DateField(default=django.utils.timezone.localdate),
+        ),
+        migrations.AddField(
+            model_name='blog',
+            name='story_hash',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='blog',
+            name='story_html',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AlterField(
+            model_name='blog',
+            name='date',
+            field=models.CharField(blank=True, help_text='Display label for the publication date. Leave blank to derive it from published on.', max_length=50),
+        ),
+        migrations.AlterField(
+            model_name='blog',
+            name='read_time',
+            field=models.CharField(blank=True, editable=False, max_length=50),
+        ),
+        migrations.RunPython(set_published_on, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='blog',
+            index=models.Index(fields=['published_on', 'id'], name='blog_published_id_idx'),
+        ),
+    ]
@@ -1,10 +1,58 @@
 import uuid
 
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
+from django.utils import timezone
 from django.utils.text import slugify
 
+from .images import refresh_image_variants
+from .rendering import content_hash, read_time_for, render_description
+
+SEARCH_CONFIG = "english"
+
+
+def _array_text(field):
+    return models.Func(
+        models.F(field), models.Value(" "), function="array_to_string", output_field=models.TextField()
+    )
+
+
+PROJECT_SEARCH_VECTOR = (
+    SearchVector("title", weight="A", config=SEARCH_CONFIG)
+    + SearchVector("short_desc", weight="B", config=SEARCH_CONFIG)
+    + SearchVector(_array_text("tech_stack"), weight="B", config=SEARCH_CONFIG)
+    + SearchVector("description", weight="C", config=SEARCH_CONFIG)
+)
+PROJECT_SEARCH_FIELDS = {"title", "short_desc", "tech_stack", "description"}
+
+BLOG_SEARCH_VECTOR = (
+    SearchVector("title", weight="A", config=SEARCH_CONFIG)
+    + SearchVector("short_desc", weight="B", config=SEARCH_CONFIG)
+    + SearchVector(_array_text("highlights"), weight="B", config=SEARCH_CONFIG)
+    + SearchVector("story", weight="C", config=SEARCH_CONFIG)
+)
+BLOG_SEARCH_FIELDS = {"title", "short_desc", "highlights", "story"}
+
+IMAGE_FIELDS = {"image_url", "images"}
+
+
+def _touches(update_fields, fields):
+    return update_fields is None or not fields.isdisjoint(update_fields)
+
+
+def _date_label(day):
+    return f"{day:%B} {day.day}, {day.year}"
+
+
+def _refresh_images(instance, kwargs):
+    update_fields = kwargs.get("update_fields")
+    if _touches(update_fields, IMAGE_FIELDS) and refresh_image_variants(instance):
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "image_variants"}
+
 
 class Project(models.Model):
     class Category(models.TextChoices):
@@ -17,22 +65,51 @@ class Project(models.Model):
     slug = models.SlugField(max_length=200, unique=True, blank=True)
     short_desc = models.CharField(max_length=240)
     description = models.TextField()
+    description_html = models.TextField(blank=True, editable=False)
+    description_hash = models.CharField(max_length=64, blank=True, editable=False)
     tech_stack = ArrayField(models.CharField(max_length=100), blank=True, default=list)
     image_url = models.URLField(blank=True)
     images = ArrayField(models.URLField(), blank=True, default=list)
+    image_variants = models.JSONField(blank=True, default=dict, editable=False)
     live_url = models.URLField(blank=True)
     github_url = models.URLField(blank=True)
     category = models.CharField(max_length=20, choices=Category.choices)
+    search_vector = SearchVectorField(blank=True, null=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["title"]
+        indexes = [
+            models.Index(fields=["created_at", "id"], name="project_created_id_idx"),
+            models.Index(fields=["category"], name="project_category_idx"),
+            GinIndex(fields=["tech_stack"], name="project_tech_stack_idx"),
+            GinIndex(fields=["search_vector"], name="project_search_idx"),
+        ]
+
+    def refresh_description_html(self, force=False):
+        """Re-render ``description_html`` if the description changed.
+
+        Returns True when the stored HTML was updated.
+        """
+        digest = content_hash(self.description)
+        if not force and digest == self.description_hash:
+            return False
+        self.description_html = render_description(self.description)
+        self.description_hash = digest
+        return True
 
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = slugify(self.title)
+        if self.refresh_description_html():
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "description_html", "description_hash"}
+        _refresh_images(self, kwargs)
         super().save(*args, **kwargs)
+        if _touches(kwargs.get("update_fields"), PROJECT_SEARCH_FIELDS):
+            Project.objects.filter(pk=self.pk).update(search_vector=PROJECT_SEARCH_VECTOR)
 
     def __str__(self):
         return self.title
@@ -55,9 +132,19 @@ class Skill(models.Model):
         default=70,
         help_text="Proficiency score from 1-100.",
     )
+    featured_rank = models.PositiveSmallIntegerField(
+        blank=True,
+        null=True,
+        db_index=True,
+        help_text="Position on the homepage (1 is first). Leave blank to rank by proficiency.",
+    )
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["category", "name"]
+        indexes = [
+            models.Index(fields=["-proficiency_level"], name="skill_proficiency_idx"),
+        ]
 
     def __str__(self):
         return self.name
@@ -92,6 +179,7 @@ class Education(models.Model):
         validators=[MinValueValidator(1900), MaxValueValidator(2100)],
     )
     description = models.TextField(blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["-start_year"]
@@ -118,28 +206,122 @@ class ContactMessage(models.Model):
         return f"{self.name} ({self.email})"
 
 
+class WebhookOutbox(models.Model):
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        DELIVERED = "delivered", "Delivered"
+        FAILED = "failed", "Failed"
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    contact_message = models.ForeignKey(
+        ContactMessage,
+        on_delete=models.CASCADE,
+        related_name="webhook_deliveries",
+        blank=True,
+        null=True,
+    )
+    payload = models.JSONField()
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_status_code = models.PositiveSmallIntegerField(blank=True, null=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    delivered_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        verbose_name = "webhook delivery"
+        verbose_name_plural = "webhook outbox"
+        indexes = [
+            models.Index(fields=["status", "next_attempt_at"], name="outbox_due_idx"),
+        ]
+
+    def __str__(self):
+        return f"Webhook {self.status} ({self.attempts} attempt(s))"
+
+
 class Blog(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     title = models.CharField(max_length=180)
     slug = models.SlugField(max_length=200, unique=True, blank=True)
     short_desc = models.CharField(max_length=240)
     category = models.CharField(max_length=50)
-    read_time = models.CharField(max_length=50)
-    date = models.CharField(max_length=50)
+    read_time = models.CharField(max_length=50, blank=True, editable=False)
+    published_on = models.DateField(default=timezone.localdate)
+    date = models.CharField(
+        max_length=50,
+        blank=True,
+        help_text="Display label for the publication date. Leave blank to derive it from published on.",
+    )
     image_url = models.URLField(blank=True)
     images = ArrayField(models.URLField(), blank=True, default=list)
+    image_variants = models.JSONField(blank=True, default=dict, editable=False)
     story = models.TextField()
+    story_html = models.TextField(blank=True, editable=False)
+    story_hash = models.CharField(max_length=64, blank=True, editable=False)
     highlights = ArrayField(models.CharField(max_length=500), blank=True, default=list)
+    search_vector = SearchVectorField(blank=True, null=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
-        ordering = ["-created_at"]
+        ordering = ["-published_on", "-id"]
+        indexes = [
+            models.Index(fields=["created_at", "id"], name="blog_created_id_idx"),
+            models.Index(fields=["published_on", "id"], name="blog_published_id_idx"),
+            GinIndex(fields=["search_vector"], name="blog_search_idx"),
+        ]
+
+    def refresh_story_html(self, force=False):
+        """Re-render ``story_html`` and ``read_time`` if the story changed.
+
+        Returns True when the stored fields were updated.
+        """
+        digest = content_hash(self.story)
+        if not force and digest == self.story_hash:
+            return False
+        self.story_html = render_description(self.story)
+        self.story_hash = digest
+        self.read_time = read_time_for(self.story)
+        return True
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # The stored label follows published_on only if it was derived from it.
+        instance._loaded_published_on = instance.__dict__.get("published_on")
+        return instance
+
+    def refresh_date_label(self):
+        """Derive the ``date`` label from ``published_on``.
+
+        Blank labels, and labels still derived from the ``published_on`` the
+        row was loaded with, follow ``published_on``; hand-written labels are
+        kept. Returns True when ``date`` changed.
+        """
+        loaded = getattr(self, "_loaded_published_on", None)
+        if self.date and not (loaded and self.date == _date_label(loaded)):
+            return False
+        label = _date_label(self.published_on)
+        if label == self.date:
+            return False
+        self.date = label
+        return True
 
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = slugify(self.title)
+        update_fields = kwargs.get("update_fields")
+        if self.refresh_date_label() and update_fields is not None:
+            kwargs["update_fields"] = update_fields = {*update_fields, "date"}
+        if self.refresh_story_html() and update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "story_html", "story_hash", "read_time"}
+        _refresh_images(self, kwargs)
         super().save(*args, **kwargs)
+        self._loaded_published_on = self.published_on
+        if _touches(kwargs.get("update_fields"), BLOG_SEARCH_FIELDS):
+            Blog.objects.filter(pk=self.pk).update(search_vector=BLOG_SEARCH_VECTOR)
 
     def __str__(self):
         return self.title
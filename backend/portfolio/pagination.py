@@ -0,0 +1,104 @@
+import base64
+import uuid
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils.dateparse import parse_date, parse_datetime
+
+
+class InvalidPage(ValueError):
+    pass
+
+
+@dataclass
+class Page:
+    items: list
+    next_cursor: str | None
+
+
+def encode_cursor(value, pk):
+    raw = f"{value.isoformat()}|{pk}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor, parse=parse_datetime):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value, pk = base64.urlsafe_b64decode(padded).decode("utf-8").split("|", 1)
+        parsed = parse(value)
+        if parsed is None:
+            raise ValueError(value)
+        return parsed, uuid.UUID(pk)
+    except (ValueError, UnicodeDecodeError):
+        raise InvalidPage("Invalid cursor.") from None
+
+
+def _parse_limit(value):
+    max_limit = getattr(settings, "API_MAX_PAGE_SIZE", 100)
+    if value in (None, ""):
+        return min(getattr(settings, "API_PAGE_SIZE", 20), max_limit)
+    try:
+        limit = int(value)
+    except ValueError:
+        raise InvalidPage("limit must be an integer.") from None
+    if limit < 1:
+        raise InvalidPage("limit must be a positive integer.")
+    return min(limit, max_limit)
+
+
+def keyset_query(request, selection, key="created_at"):
+    """Return ``(queryset, limit)`` for one page of ``selection``, or None.
+
+    The queryset fetches one row past ``limit`` so ``build_page`` can tell
+    whether another page follows. None means the request asks for nothing
+    paginated and ``API_PAGINATE_LISTS`` is off.
+    """
+    limit_param = request.GET.get("limit")
+    cursor = request.GET.get("cursor")
+    if not getattr(settings, "API_PAGINATE_LISTS", False) and limit_param is None and cursor is None:
+        return None
+
+    limit = _parse_limit(limit_param)
+    queryset = selection.queryset
+    field = queryset.model._meta.get_field(key)
+    parse = parse_datetime if field.get_internal_type() == "DateTimeField" else parse_date
+    queryset = queryset.order_by(f"-{key}", "-id")
+    if cursor:
+        value, pk = decode_cursor(cursor, parse)
+        queryset = queryset.filter(Q(**{f"{key}__lt": value}) | Q(**{key: value, "id__lt": pk}))
+    return queryset[: limit + 1], limit
+
+
+def build_page(rows, limit, selection, key="created_at"):
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(last[selection.columns.index(key)], last[selection.columns.index("id")])
+    return Page(items=rows, next_cursor=next_cursor)
+
+
+def paginate_keyset(request, selection, key="created_at"):
+    """Return a ``Page`` of ``selection`` ordered newest first on ``(key, id)``.
+
+    ``key`` is a date or datetime field; ``selection`` (see
+    ``projections.Schema.select``) must include it and ``id`` among its
+    columns. Page items are the raw row tuples.
+    Returns None when the request asks for nothing paginated and
+    ``API_PAGINATE_LISTS`` is off, so callers can keep the legacy full list.
+    """
+    query = keyset_query(request, selection, key)
+    if query is None:
+        return None
+    queryset, limit = query
+    return build_page(list(queryset), limit, selection, key)
+
+
+async def apaginate_keyset(request, selection, key="created_at"):
+    """Async ``paginate_keyset``."""
+    query = keyset_query(request, selection, key)
+    if query is None:
+        return None
+    queryset, limit = query
+    return build_page([row async for row in queryset], limit, selection, key)
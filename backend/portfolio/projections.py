@@ -0,0 +1,125 @@
+from dataclasses import dataclass, field
+
+from .models import Blog, Education, Project, Skill
+
+
+class InvalidFields(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class Selection:
+    """A compiled read: ``queryset`` yields tuples, ``encode`` turns one into a dict."""
+
+    queryset: object
+    columns: tuple
+    fields: tuple
+
+    def encode(self, row):
+        # zip stops at the shorter side, so trailing ordering/cursor columns are dropped.
+        return dict(zip(self.fields, row))
+
+    def encode_all(self, rows):
+        fields = self.fields
+        return [dict(zip(fields, row)) for row in rows]
+
+
+@dataclass(frozen=True)
+class Schema:
+    """The API shape of one resource.
+
+    ``fields`` is everything the detail endpoint returns, in output order;
+    list endpoints leave out ``detail_only``. Every endpoint and serializer
+    builds its output from these, so they cannot drift apart.
+    """
+
+    model: type
+    fields: tuple
+    detail_only: frozenset = field(default_factory=frozenset)
+
+    @property
+    def list_fields(self):
+        return tuple(name for name in self.fields if name not in self.detail_only)
+
+    def requested_fields(self, request, detail=False):
+        """Return the fields selected by ``?fields=``, or the default set when absent.
+
+        Fields are returned in schema order so responses stay stable however
+        the client orders the parameter.
+        """
+        default = self.fields if detail else self.list_fields
+        raw = request.GET.get("fields")
+        if raw is None:
+            return default
+
+        names = {name.strip() for name in raw.split(",") if name.strip()}
+        unknown = names.difference(self.fields)
+        if unknown:
+            raise InvalidFields(f"Unknown fields: {', '.join(sorted(unknown))}.")
+        if not names:
+            raise InvalidFields("fields must name at least one field.")
+        return tuple(name for name in self.fields if name in names)
+
+    def select(self, queryset=None, fields=None, extra=()):
+        """Compile ``fields`` (default: the list fields) into a ``values_list()`` query.
+
+        ``extra`` columns are selected after the output fields, for ordering
+        and cursors, without appearing in the encoded output.
+        """
+        fields = self.list_fields if fields is None else fields
+        columns = fields + tuple(name for name in extra if name not in fields)
+        queryset = self.model.objects.all() if queryset is None else queryset
+        return Selection(queryset.values_list(*columns), columns, fields)
+
+
+PROJECT_SCHEMA = Schema(
+    Project,
+    fields=(
+        "id",
+        "title",
+        "slug",
+        "short_desc",
+        "description",
+        "description_html",
+        "tech_stack",
+        "image_url",
+        "images",
+        "image_variants",
+        "live_url",
+        "github_url",
+        "category",
+        "created_at",
+        "updated_at",
+    ),
+    detail_only=frozenset({"description", "description_html"}),
+)
+
+BLOG_SCHEMA = Schema(
+    Blog,
+    fields=(
+        "id",
+        "title",
+        "slug",
+        "short_desc",
+        "category",
+        "read_time",
+        "date",
+        "published_on",
+        "image_url",
+        "images",
+        "image_variants",
+        "story",
+        "story_html",
+        "highlights",
+        "created_at",
+        "updated_at",
+    ),
+    detail_only=frozenset({"story", "story_html", "highlights"}),
+)
+
+SKILL_SCHEMA = Schema(Skill, fields=("id", "name", "category", "icon_url", "proficiency_level"))
+
+EDUCATION_SCHEMA = Schema(
+    Education,
+    fields=("id", "degree", "institution", "start_year", "end_year", "description"),
+)
@@ -0,0 +1,163 @@
+import logging
+import math
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+
+from .responses import FastJsonResponse
+
+logger = logging.getLogger(__name__)
+
+# Sliding-window log kept in a sorted set scored by request time (ms). The
+# prune, count and insert happen in one atomic server-side call.
+SLIDING_WINDOW_SCRIPT = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+local count = redis.call('ZCARD', key)
+if count < limit then
+  redis.call('ZADD', key, now, ARGV[4])
+  redis.call('PEXPIRE', key, window)
+  return {1, count + 1, 0}
+end
+local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+return {0, count, tonumber(oldest[2]) + window - now}
+"""
+
+
+@dataclass
+class RateLimitResult:
+    allowed: bool
+    count: int
+    retry_after: int
+
+
+def client_ip(request):
+    """Return the client address, trusting only ``RATELIMIT_TRUSTED_PROXY_COUNT`` proxies.
+
+    Each trusted proxy appends the address it received the request from to
+    ``X-Forwarded-For``, so the client is the Nth entry from the right;
+    anything further left is client-supplied and ignored.
+    """
+    trusted = getattr(settings, "RATELIMIT_TRUSTED_PROXY_COUNT", 0)
+    if trusted > 0:
+        forwarded_for = [
+            part.strip()
+            for part in request.META.get("HTTP_X_FORWARDED_FOR", "").split(",")
+            if part.strip()
+        ]
+        if len(forwarded_for) >= trusted:
+            return forwarded_for[-trusted]
+    return request.META.get("REMOTE_ADDR", "unknown")
+
+
+class SlidingWindowRateLimiter:
+    """Allow at most ``limit`` hits per ``window`` seconds for each key.
+
+    Uses a Lua script when the default cache is django-redis. Other backends
+    fall back to a lock-guarded read-modify-write, which is atomic for the
+    per-process LocMem cache.
+    """
+
+    def __init__(self, limit, window):
+        self.limit = limit
+        self.window_ms = int(window * 1000)
+        self._lock = threading.Lock()
+        self._script = None
+        self._script_client = None
+
+    def hit(self, key):
+        now_ms = int(time.time() * 1000)
+        client = _redis_client()
+        if client is not None:
+            return self._hit_redis(client, cache.make_and_validate_key(key), now_ms)
+        return self._hit_local(key, now_ms)
+
+    def _hit_redis(self, client, key, now_ms):
+        if self._script is None or self._script_client is not client:
+            self._script = client.register_script(SLIDING_WINDOW_SCRIPT)
+            self._script_client = client
+        allowed, count, retry_ms = self._script(
+            keys=[key], args=[now_ms, self.window_ms, self.limit, f"{now_ms}-{uuid.uuid4().hex}"]
+        )
+        return RateLimitResult(bool(allowed), int(count), math.ceil(int(retry_ms) / 1000))
+
+    def _hit_local(self, key, now_ms):
+        with self._lock:
+            window_start = now_ms - self.window_ms
+            hits = [stamp for stamp in cache.get(key, []) if stamp > window_start]
+            if len(hits) >= self.limit:
+                retry_ms = hits[0] + self.window_ms - now_ms
+                return RateLimitResult(False, len(hits), math.ceil(retry_ms / 1000))
+            hits.append(now_ms)
+            cache.set(key, hits, timeout=math.ceil(self.window_ms / 1000))
+            return RateLimitResult(True, len(hits), 0)
+
+
+def _redis_client():
+    try:
+        from django_redis import get_redis_connection
+    except ImportError:
+        return None
+    try:
+        return get_redis_connection("default")
+    except NotImplementedError:
+        return None
+
+
+def rate_limit(scope, limit, window, key=client_ip):
+    """Reject requests over ``limit`` per ``window`` seconds with a 429.
+
+    The check runs before the view, so over-limit requests are rejected
+    without reading or parsing the body. Cache errors fail open. Async views
+    run the check in ``sync_to_async``.
+    """
+    limiter = SlidingWindowRateLimiter(limit, window)
+
+    def check(request):
+        """Return a 429 response when ``request`` is over the limit, else None."""
+        try:
+            result = limiter.hit(f"ratelimit:{scope}:{key(request)}")
+        except Exception:
+            logger.warning("Rate limiter unavailable for scope=%s", scope, exc_info=True)
+            return None
+
+        if not result.allowed:
+            response = FastJsonResponse(
+                {"detail": "Rate limit exceeded. Please try again later."},
+                status=429,
+            )
+            response["Retry-After"] = str(max(result.retry_after, 1))
+            return response
+        return None
+
+    def decorator(view_func):
+        if iscoroutinefunction(view_func):
+
+            @wraps(view_func)
+            async def _async_wrapped_view(request, *args, **kwargs):
+                rejected = await sync_to_async(check)(request)
+                if rejected is not None:
+                    return rejected
+                return await view_func(request, *args, **kwargs)
+
+            return _async_wrapped_view
+
+        @wraps(view_func)
+        def _wrapped_view(request, *args, **kwargs):
+            rejected = check(request)
+            if rejected is not None:
+                return rejected
+            return view_func(request, *args, **kwargs)
+
+        return _wrapped_view
+
+    return decorator
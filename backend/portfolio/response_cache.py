@@ -0,0 +1,275 @@
+import hashlib
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import wraps
+from urllib.parse import urlencode
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
+
+from .compression import apply_encoding, available_encodings, compress, min_size, negotiate
+from .instrumentation import count_cache, timed
+from .snapshots import snapshot_entry
+
+VERSION_KEY_PREFIX = "api:version:"
+RESPONSE_KEY_PREFIX = "api:response:"
+
+_stats_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0}
+
+
+def _version_key(namespace):
+    return f"{VERSION_KEY_PREFIX}{namespace}"
+
+
+def _new_version():
+    # The timestamp prefix doubles as the namespace's last change time, which
+    # covers deletions that max(updated_at) cannot see.
+    return f"{time.time():.6f}-{uuid.uuid4().hex}"
+
+
+def get_versions(namespaces):
+    """Return the current version token for each namespace, creating missing ones."""
+    keys = [_version_key(namespace) for namespace in namespaces]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            token = _new_version()
+            if not cache.add(key, token, timeout=None):
+                token = cache.get(key) or token
+            versions[key] = token
+    return [versions[key] for key in keys]
+
+
+def bump_version(namespace):
+    cache.set(_version_key(namespace), _new_version(), timeout=None)
+
+
+def versions_changed_at(versions):
+    timestamps = []
+    for token in versions:
+        try:
+            timestamps.append(float(token.split("-", 1)[0]))
+        except ValueError:
+            continue
+    if not timestamps:
+        return None
+    return datetime.fromtimestamp(max(timestamps), tz=timezone.utc)
+
+
+def cache_stats():
+    with _stats_lock:
+        hits, misses = _stats["hits"], _stats["misses"]
+    total = hits + misses
+    return {"hits": hits, "misses": misses, "hit_ratio": hits / total if total else 0.0}
+
+
+def reset_cache_stats():
+    with _stats_lock:
+        _stats["hits"] = 0
+        _stats["misses"] = 0
+
+
+def _record(outcome):
+    with _stats_lock:
+        _stats[outcome] += 1
+    count_cache(outcome)
+
+
+def _key_params(request, params):
+    """The query string items that select a cached variant.
+
+    With ``params`` given, other parameters are ignored, so junk like
+    ``?x=<random>`` cannot create entries. Views read single values, so only
+    the last value of a repeated parameter counts.
+    """
+    if params is None:
+        return sorted(request.GET.lists())
+    return [(name, request.GET[name]) for name in sorted(params) if name in request.GET]
+
+
+def response_cache_key(request, versions, params=None):
+    query = urlencode(_key_params(request, params), doseq=True)
+    raw = f"{request.path}?{query}|{':'.join(versions)}"
+    return RESPONSE_KEY_PREFIX + hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def compute_etag(body):
+    return f'"{hashlib.sha256(body).hexdigest()}"'
+
+
+def cache_control_for(request):
+    policies = getattr(settings, "API_CACHE_CONTROL", {})
+    url_name = request.resolver_match.url_name if request.resolver_match else None
+    return policies.get(url_name, policies.get("default", {}))
+
+
+def _timestamp(value):
+    return int(value.timestamp()) if value else None
+
+
+def _finalize(response, cache_control):
+    patch_cache_control(response, **cache_control)
+    patch_vary_headers(response, ("Accept-Encoding",))
+
+
+def _encode(request, response, variants):
+    """Serve a precompressed variant when the client accepts one."""
+    if len(response.content) < min_size():
+        return
+    encoding = negotiate(request.META.get("HTTP_ACCEPT_ENCODING"))
+    if encoding is None:
+        return
+    body = variants.get(encoding) or compress(response.content, encoding)
+    apply_encoding(response, body, encoding)
+
+
+def _latest(*values):
+    values = [value for value in values if value is not None]
+    return max(values) if values else None
+
+
+@dataclass
+class _Lookup:
+    """Outcome of the cache lookup that precedes running a view.
+
+    ``response`` is set when the view need not run (a hit or a 304);
+    otherwise the remaining fields carry what storing the result needs.
+    """
+
+    response: HttpResponse | None = None
+    key: str | None = None
+    modified_ts: int | None = None
+    enabled: bool = False
+
+
+def _lookup(request, namespaces, params, last_modified, args, kwargs):
+    entry = None
+    if getattr(settings, "API_SNAPSHOT_MODE", False) and not _key_params(request, params):
+        entry = snapshot_entry(request.path)
+
+    enabled = getattr(settings, "API_CACHE_ENABLED", True)
+    if entry is None:
+        with timed("cache"):
+            versions = get_versions(namespaces)
+            key = response_cache_key(request, versions, params)
+            entry = cache.get(key) if enabled else None
+        source = "HIT"
+    else:
+        source = "SNAPSHOT"
+
+    if entry is None:
+        modified_ts = _timestamp(
+            _latest(
+                last_modified(request, *args, **kwargs) if last_modified else None,
+                versions_changed_at(versions),
+            )
+        )
+        not_modified = get_conditional_response(request, last_modified=modified_ts)
+        if not_modified is not None:
+            _finalize(not_modified, cache_control_for(request))
+            return _Lookup(response=not_modified)
+        if enabled:
+            _record("misses")
+        return _Lookup(key=key, modified_ts=modified_ts, enabled=enabled)
+
+    _record("hits")
+    modified_ts = entry["last_modified"]
+    response = HttpResponse(entry["body"], status=entry["status"], content_type=entry["content_type"])
+    response["ETag"] = entry["etag"]
+    if modified_ts:
+        response["Last-Modified"] = http_date(modified_ts)
+    response["X-Cache"] = source
+    return _Lookup(response=_respond(request, response, modified_ts, entry.get("encoded", {})))
+
+
+def _store(request, lookup, response):
+    if response.status_code != 200 or response.streaming:
+        return response
+
+    response["ETag"] = compute_etag(response.content)
+    if lookup.modified_ts:
+        response["Last-Modified"] = http_date(lookup.modified_ts)
+    variants = {}
+    if lookup.enabled:
+        # Compress once per content version so hits never pay for it.
+        if len(response.content) >= min_size():
+            variants = {encoding: compress(response.content, encoding) for encoding in available_encodings()}
+        with timed("cache"):
+            cache.set(
+                lookup.key,
+                {
+                    "body": response.content,
+                    "status": response.status_code,
+                    "content_type": response["Content-Type"],
+                    "etag": response["ETag"],
+                    "last_modified": lookup.modified_ts,
+                    "encoded": variants,
+                },
+                timeout=getattr(settings, "API_CACHE_TIMEOUT", None),
+            )
+        response["X-Cache"] = "MISS"
+    return _respond(request, response, lookup.modified_ts, variants)
+
+
+def _respond(request, response, modified_ts, variants):
+    _encode(request, response, variants)
+    _finalize(response, cache_control_for(request))
+    return get_conditional_response(
+        request,
+        etag=response["ETag"],
+        last_modified=modified_ts,
+        response=response,
+    )
+
+
+def cached_response(*namespaces, params=None, last_modified=None):
+    """Cache successful responses of a read-only view and answer conditional GETs.
+
+    Entries are keyed by path, query and the version tokens of ``namespaces``;
+    bumping any version invalidates them. ``params`` names the query
+    parameters the view reads; only those are part of the key (all of them
+    when ``None``). ``last_modified`` is an optional
+    ``(request, *args, **kwargs) -> datetime`` used to answer
+    ``If-Modified-Since`` without running the view when nothing is cached.
+
+    With ``API_SNAPSHOT_MODE`` on, requests without key parameters are answered from
+    the exported snapshot (see ``export_api_snapshot``) without touching the
+    cache or the database.
+
+    Works on sync and async views; for async views the cache lookup and store
+    each run in one ``sync_to_async`` call around the awaited view.
+    """
+
+    def decorator(view_func):
+        if iscoroutinefunction(view_func):
+
+            @wraps(view_func)
+            async def _async_wrapped_view(request, *args, **kwargs):
+                lookup = await sync_to_async(_lookup)(
+                    request, namespaces, params, last_modified, args, kwargs
+                )
+                if lookup.response is not None:
+                    return lookup.response
+                response = await view_func(request, *args, **kwargs)
+                return await sync_to_async(_store)(request, lookup, response)
+
+            return _async_wrapped_view
+
+        @wraps(view_func)
+        def _wrapped_view(request, *args, **kwargs):
+            lookup = _lookup(request, namespaces, params, last_modified, args, kwargs)
+            if lookup.response is not None:
+                return lookup.response
+            return _store(request, lookup, view_func(request, *args, **kwargs))
+
+        return _wrapped_view
+
+    return decorator
@@ -0,0 +1,64 @@
+import datetime
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse
+
+from .instrumentation import timed
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# Dates and times go through DjangoJSONEncoder so the wire format stays the
+# one JsonResponse produced (millisecond precision, "Z" for UTC); orjson
+# would emit microseconds.
+ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+EXACT_ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+
+
+class ExactJSONEncoder(DjangoJSONEncoder):
+    """Stdlib fallback for ``exact_times``: full precision, formatted like orjson."""
+
+    def default(self, o):
+        if isinstance(o, (datetime.datetime, datetime.time)):
+            value = o.isoformat()
+            return value.removesuffix("+00:00") + "Z" if value.endswith("+00:00") else value
+        return super().default(o)
+
+
+_fallback_encoder = DjangoJSONEncoder(separators=(",", ":"), ensure_ascii=False)
+_exact_encoder = ExactJSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+
+def _orjson_default(value):
+    # Dates and times (see ORJSON_OPTIONS), Decimal, timedelta and lazy
+    # translation strings.
+    return _fallback_encoder.default(value)
+
+
+def dumps(data, exact_times=False):
+    """Encode ``data`` to UTF-8 JSON bytes, using orjson when it is installed.
+
+    Times are rounded to milliseconds like ``JsonResponse`` does; pass
+    ``exact_times`` to keep microseconds (exports that must round-trip).
+    """
+    with timed("json"):
+        if orjson is not None:
+            options = EXACT_ORJSON_OPTIONS if exact_times else ORJSON_OPTIONS
+            return orjson.dumps(data, default=_orjson_default, option=options)
+        encoder = _exact_encoder if exact_times else _fallback_encoder
+        return encoder.encode(data).encode("utf-8")
+
+
+class FastJsonResponse(HttpResponse):
+    """Drop-in replacement for ``JsonResponse`` backed by :func:`dumps`."""
+
+    def __init__(self, data, safe=True, **kwargs):
+        if safe and not isinstance(data, dict):
+            raise TypeError(
+                "In order to allow non-dict objects to be serialized set the "
+                "safe parameter to False."
+            )
+        kwargs.setdefault("content_type", "application/json")
+        super().__init__(content=dumps(data), **kwargs)
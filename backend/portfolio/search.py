@@ -0,0 +1,54 @@
+from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank
+from django.db.models import F
+from django.utils.html import escape
+
+from .models import SEARCH_CONFIG, Blog, Project
+
+# ts_headline markers that cannot occur in content; swapped for <mark> after
+# the snippet has been HTML-escaped.
+_START, _STOP = "\x02", "\x03"
+
+
+def _snippet(text):
+    return escape(text or "").replace(_START, "<mark>").replace(_STOP, "</mark>")
+
+
+def _search(model, kind, body_field, query, limit):
+    rows = (
+        model.objects.filter(search_vector=query)
+        .annotate(
+            rank=SearchRank(F("search_vector"), query),
+            snippet=SearchHeadline(
+                body_field,
+                query,
+                config=SEARCH_CONFIG,
+                start_sel=_START,
+                stop_sel=_STOP,
+                max_words=35,
+                min_words=15,
+                max_fragments=2,
+            ),
+        )
+        .order_by("-rank", "slug")
+        .values("slug", "title", "short_desc", "rank", "snippet")[:limit]
+    )
+    return [
+        {
+            "type": kind,
+            "slug": row["slug"],
+            "title": row["title"],
+            "short_desc": row["short_desc"],
+            "rank": round(row["rank"], 6),
+            "snippet": _snippet(row["snippet"]),
+        }
+        for row in rows
+    ]
+
+
+def search_content(text, limit):
+    """Full-text search over projects and blogs, best matches first."""
+    query = SearchQuery(text, search_type="websearch", config=SEARCH_CONFIG)
+    results = _search(Project, "project", "description", query, limit)
+    results += _search(Blog, "blog", "story", query, limit)
+    results.sort(key=lambda result: result["rank"], reverse=True)
+    return results[:limit]
@@ -1,63 +1,34 @@
-import bleach
-import markdown
 from rest_framework import serializers
 
 from .models import Blog, Project, Skill, Education, Experience, ContactMessage
+from .projections import BLOG_SCHEMA, EDUCATION_SCHEMA, PROJECT_SCHEMA, SKILL_SCHEMA
 
+# Field lists come from the API schemas in projections.py so these stay in
+# sync with what the views return.
 
-class ProjectSerializer(serializers.ModelSerializer):
-    description_html = serializers.SerializerMethodField()
 
+class ProjectSerializer(serializers.ModelSerializer):
     class Meta:
         model = Project
-        fields = [
-            "id",
-            "title",
-            "slug",
-            "short_desc",
-            "description",
-            "description_html",
-            "tech_stack",
-            "image_url",
-            "images",
-            "live_url",
-            "github_url",
-            "category",
-            "created_at",
-            "updated_at",
-        ]
-
-    def get_description_html(self, obj):
-        allowed_tags = [
-            'p', 'strong', 'em', 'u', 'ol', 'ul', 'li', 'br',
-            'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'a', 'img', 'code', 'pre'
-        ]
-        allowed_attrs = {
-            '*': ['class'],
-            'a': ['href', 'title'],
-            'img': ['src', 'alt', 'title'],
-        }
-        
-        html = markdown.markdown(obj.description, extensions=['extra', 'nl2br'])
-        return bleach.clean(html, tags=allowed_tags, attributes=allowed_attrs)
+        fields = list(PROJECT_SCHEMA.fields)
 
 
 class BlogSerializer(serializers.ModelSerializer):
     class Meta:
         model = Blog
-        fields = "__all__"
+        fields = list(BLOG_SCHEMA.fields)
 
 
 class SkillSerializer(serializers.ModelSerializer):
     class Meta:
         model = Skill
-        fields = "__all__"
+        fields = list(SKILL_SCHEMA.fields)
 
 
 class EducationSerializer(serializers.ModelSerializer):
     class Meta:
         model = Education
-        fields = "__all__"
+        fields = list(EDUCATION_SCHEMA.fields)
 
 
 class ExperienceSerializer(serializers.ModelSerializer):
@@ -0,0 +1,28 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_save
+
+from .instrumentation import install_db_wrapper
+from .models import Blog, Education, Project, Skill
+from .response_cache import bump_version
+
+CACHE_NAMESPACES = {
+    Project: "projects",
+    Blog: "blogs",
+    Skill: "skills",
+    Education: "education",
+}
+
+
+def invalidate_response_cache(sender, **kwargs):
+    transaction.on_commit(partial(bump_version, CACHE_NAMESPACES[sender]))
+
+
+def connect_signals():
+    for model in CACHE_NAMESPACES:
+        uid = f"portfolio-response-cache-{model._meta.model_name}"
+        post_save.connect(invalidate_response_cache, sender=model, dispatch_uid=uid)
+        post_delete.connect(invalidate_response_cache, sender=model, dispatch_uid=uid)
+    connection_created.connect(install_db_wrapper, dispatch_uid="portfolio-request-metrics")
@@ -0,0 +1,56 @@
+import json
+import os
+import threading
+
+from django.conf import settings
+
+MANIFEST_NAME = "manifest.json"
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+_lock = threading.Lock()
+_loaded = {"mtime": None, "entries": {}}
+
+
+def snapshot_dir():
+    return settings.API_SNAPSHOT_DIR
+
+
+def _read_entries(root, manifest):
+    entries = {}
+    for path, item in manifest["entries"].items():
+        file_path = root / item["file"]
+        encoded = {}
+        for encoding, suffix in ENCODING_SUFFIXES.items():
+            variant = file_path.with_name(file_path.name + suffix)
+            if variant.exists():
+                encoded[encoding] = variant.read_bytes()
+        entries[path] = {
+            "body": file_path.read_bytes(),
+            "status": 200,
+            "content_type": "application/json",
+            "etag": item["etag"],
+            "last_modified": manifest["generated_at"],
+            "encoded": encoded,
+        }
+    return entries
+
+
+def snapshot_entry(path):
+    """Return the exported response for ``path`` in response-cache entry form.
+
+    The snapshot is loaded into memory once and reloaded only when a new
+    export replaces the manifest.
+    """
+    manifest_path = snapshot_dir() / MANIFEST_NAME
+    try:
+        mtime = os.stat(manifest_path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    if mtime != _loaded["mtime"]:
+        with _lock:
+            if mtime != _loaded["mtime"]:
+                manifest = json.loads(manifest_path.read_text())
+                _loaded["entries"] = _read_entries(manifest_path.parent, manifest)
+                _loaded["mtime"] = mtime
+    return _loaded["entries"].get(path)
@@ -1,23 +1,20 @@
+from django.conf import settings
 from django.urls import path
 
-from .views import (
-    contact_message_create,
-    education_list,
-    home_skill_list,
-    project_detail,
-    project_list,
-    skill_list,
-    blog_list,
-    blog_detail,
-)
+from . import async_views, views
+
+# Both modules define the same view names; see API_ASYNC_VIEWS in settings.
+api = async_views if settings.API_ASYNC_VIEWS else views
 
 urlpatterns = [
-    path("projects/", project_list, name="project-list"),
-    path("projects/<slug:slug>/", project_detail, name="project-detail"),
-    path("blogs/", blog_list, name="blog-list"),
-    path("blogs/<slug:slug>/", blog_detail, name="blog-detail"),
-    path("skills/", skill_list, name="skill-list"),
-    path("skills/home/", home_skill_list, name="home-skill-list"),
-    path("education/", education_list, name="education-list"),
-    path("contact/", contact_message_create, name="contact-message-create"),
+    path("projects/", api.project_list, name="project-list"),
+    path("projects/<slug:slug>/", api.project_detail, name="project-detail"),
+    path("blogs/", api.blog_list, name="blog-list"),
+    path("blogs/<slug:slug>/", api.blog_detail, name="blog-detail"),
+    path("skills/", api.skill_list, name="skill-list"),
+    path("skills/home/", api.home_skill_list, name="home-skill-list"),
+    path("education/", api.education_list, name="education-list"),
+    path("search/", api.search, name="search"),
+    path("bootstrap/", api.bootstrap, name="bootstrap"),
+    path("contact/", api.contact_message_create, name="contact-message-create"),
 ]
@@ -1,257 +1,327 @@
+import hmac
 import json
 import logging
 
-import bleach
-import markdown
-import requests
 from django.conf import settings
-from django.core.cache import cache
 from django.core.validators import validate_email
-from django.http import JsonResponse
+from django.db import transaction
+from django.db.models import Max
+from django.http import Http404, HttpResponse
 from django.shortcuts import get_object_or_404
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_GET, require_http_methods
 
+from .instrumentation import collect, render_prometheus, store
 from .models import Blog, ContactMessage, Education, Project, Skill
+from .pagination import InvalidPage, paginate_keyset
+from .projections import BLOG_SCHEMA, EDUCATION_SCHEMA, PROJECT_SCHEMA, SKILL_SCHEMA, InvalidFields
+from .ratelimit import rate_limit
+from .response_cache import cached_response
+from .responses import FastJsonResponse
+from .search import search_content
+from .webhooks import enqueue_contact_webhook
 
 logger = logging.getLogger(__name__)
 
+HOME_SKILL_COUNT = 5
+HOME_SKILL_FALLBACK_CATEGORIES = [Skill.Category.FRONTEND, Skill.Category.BACKEND, Skill.Category.TOOLS]
+BOOTSTRAP_BLOG_LIMIT = 3
+SEARCH_DEFAULT_LIMIT = 10
+SEARCH_MAX_LIMIT = 50
+SEARCH_MAX_QUERY_LENGTH = 200
 
-def _notify_make_webhook(contact_data):
-    url = getattr(settings, "MAKE_WEBHOOK_URL", "") or ""
-    if not url:
-        return
+# Query parameters each cached view reads; the response cache keys on these
+# alone (see ``cached_response``).
+FIELDS_PARAMS = ("fields",)
+LIST_PARAMS = ("fields", "limit", "cursor")
+PROJECT_LIST_PARAMS = LIST_PARAMS + ("category", "tech", "tech_match")
+SEARCH_PARAMS = ("q", "limit")
+BOOTSTRAP_PARAMS = ("sections",)
 
-    try:
-        response = requests.post(
-            url,
-            json=contact_data,
-            timeout=(3.05, 6),
-            headers={"Content-Type": "application/json"},
-        )
-        if response.status_code >= 400:
-            logger.warning("Make webhook returned status=%s", response.status_code)
-    except Exception:
-        logger.warning("Make webhook request failed", exc_info=True)
 
+# ── Last-modified helpers ────────────────────────────────────────────────────
 
-# ── Markdown helper ──────────────────────────────────────────────────────────
+def _latest_update(model):
+    def last_modified(request, *args, **kwargs):
+        return model.objects.aggregate(latest=Max("updated_at"))["latest"]
+
+    return last_modified
 
-def render_description(text):
-    allowed_tags = [
-        'p', 'strong', 'em', 'u', 'ol', 'ul', 'li', 'br',
-        'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'a', 'code', 'pre',
-    ]
-    allowed_attrs = {
-        '*': ['class'],
-        'a': ['href', 'title'],
-    }
-    html = markdown.markdown(text or "", extensions=['extra', 'nl2br'])
-    return bleach.clean(html, tags=allowed_tags, attributes=allowed_attrs)
+
+def _slug_update(model):
+    def last_modified(request, slug):
+        return model.objects.filter(slug=slug).values_list("updated_at", flat=True).first()
+
+    return last_modified
 
 
 # ── Project views ────────────────────────────────────────────────────────────
 
+class InvalidFilter(ValueError):
+    pass
+
+
+def _csv_param(request, name):
+    return [value.strip() for value in request.GET.get(name, "").split(",") if value.strip()]
+
+
+def _filter_projects(request, queryset):
+    """Apply ``?category=`` and ``?tech=`` (with ``?tech_match=any|all``) filters."""
+    categories = _csv_param(request, "category")
+    if categories:
+        unknown = set(categories).difference(Project.Category.values)
+        if unknown:
+            raise InvalidFilter(f"Unknown category: {', '.join(sorted(unknown))}.")
+        queryset = queryset.filter(category__in=categories)
+
+    tech = _csv_param(request, "tech")
+    if tech:
+        match = request.GET.get("tech_match", "any")
+        if match == "any":
+            queryset = queryset.filter(tech_stack__overlap=tech)
+        elif match == "all":
+            queryset = queryset.filter(tech_stack__contains=tech)
+        else:
+            raise InvalidFilter("tech_match must be 'any' or 'all'.")
+    return queryset
+
+
 @require_GET
+@cached_response("projects", params=PROJECT_LIST_PARAMS, last_modified=_latest_update(Project))
 def project_list(request):
-    projects = Project.objects.all().order_by("-created_at")
-    payload = [
-        {
-            "id": p.id,
-            "title": p.title,
-            "slug": p.slug,
-            "short_desc": p.short_desc,
-            "description": p.description,
-            "description_html": render_description(p.description),
-            "tech_stack": p.tech_stack,
-            "image_url": p.image_url,
-            "images": p.images,
-            "live_url": p.live_url,
-            "github_url": p.github_url,
-            "category": p.category,
-            "created_at": p.created_at,
-            "updated_at": p.updated_at,
-        }
-        for p in projects
-    ]
-    return JsonResponse(payload, safe=False)
+    try:
+        fields = PROJECT_SCHEMA.requested_fields(request)
+        projects = _filter_projects(request, Project.objects.order_by("-created_at", "-id"))
+        selection = PROJECT_SCHEMA.select(projects, fields, extra=("id", "created_at"))
+        page = paginate_keyset(request, selection)
+    except (InvalidFields, InvalidFilter, InvalidPage) as exc:
+        return FastJsonResponse({"detail": str(exc)}, status=400)
+
+    payload = selection.encode_all(page.items if page is not None else selection.queryset)
+    if page is not None:
+        return FastJsonResponse({"results": payload, "next": page.next_cursor})
+    return FastJsonResponse(payload, safe=False)
 
 
 @require_GET
+@cached_response("projects", params=FIELDS_PARAMS, last_modified=_slug_update(Project))
 def project_detail(request, slug):
-    project = get_object_or_404(Project, slug=slug)
-    payload = {
-        "id": project.id,
-        "title": project.title,
-        "slug": project.slug,
-        "short_desc": project.short_desc,
-        "description": project.description,
-        "description_html": render_description(project.description),
-        "tech_stack": project.tech_stack,
-        "image_url": project.image_url,
-        "images": project.images,
-        "live_url": project.live_url,
-        "github_url": project.github_url,
-        "category": project.category,
-        "created_at": project.created_at,
-        "updated_at": project.updated_at,
-    }
-    return JsonResponse(payload)
+    try:
+        fields = PROJECT_SCHEMA.requested_fields(request, detail=True)
+    except InvalidFields as exc:
+        return FastJsonResponse({"detail": str(exc)}, status=400)
+    selection = PROJECT_SCHEMA.select(fields=fields)
+    return FastJsonResponse(selection.encode(get_object_or_404(selection.queryset, slug=slug)))
 
 
 # ── Blog views ───────────────────────────────────────────────────────────────
 
 @require_GET
+@cached_response("blogs", params=LIST_PARAMS, last_modified=_latest_update(Blog))
 def blog_list(request):
-    blogs = Blog.objects.all().order_by("-created_at")
-    payload = [
-        {
-            "id": b.id,
-            "title": b.title,
-            "slug": b.slug,
-            "short_desc": b.short_desc,
-            "category": b.category,
-            "read_time": b.read_time,
-            "date": b.date,
-            "image_url": b.image_url,
-            "images": b.images,
-            "story": b.story,
-            "highlights": b.highlights,
-            "created_at": b.created_at,
-            "updated_at": b.updated_at,
-        }
-        for b in blogs
-    ]
-    return JsonResponse(payload, safe=False)
+    try:
+        fields = BLOG_SCHEMA.requested_fields(request)
+        selection = BLOG_SCHEMA.select(
+            Blog.objects.order_by("-published_on", "-id"), fields, extra=("id", "published_on")
+        )
+        page = paginate_keyset(request, selection, key="published_on")
+    except (InvalidFields, InvalidPage) as exc:
+        return FastJsonResponse({"detail": str(exc)}, status=400)
+
+    payload = selection.encode_all(page.items if page is not None else selection.queryset)
+    if page is not None:
+        return FastJsonResponse({"results": payload, "next": page.next_cursor})
+    return FastJsonResponse(payload, safe=False)
 
 
 @require_GET
+@cached_response("blogs", params=FIELDS_PARAMS, last_modified=_slug_update(Blog))
 def blog_detail(request, slug):
-    blog = get_object_or_404(Blog, slug=slug)
-    payload = {
-        "id": blog.id,
-        "title": blog.title,
-        "slug": blog.slug,
-        "short_desc": blog.short_desc,
-        "category": blog.category,
-        "read_time": blog.read_time,
-        "date": blog.date,
-        "image_url": blog.image_url,
-        "images": blog.images,
-        "story": blog.story,
-        "highlights": blog.highlights,
-        "created_at": blog.created_at,
-        "updated_at": blog.updated_at,
-    }
-    return JsonResponse(payload)
+    try:
+        fields = BLOG_SCHEMA.requested_fields(request, detail=True)
+    except InvalidFields as exc:
+        return FastJsonResponse({"detail": str(exc)}, status=400)
+    selection = BLOG_SCHEMA.select(fields=fields)
+    return FastJsonResponse(selection.encode(get_object_or_404(selection.queryset, slug=slug)))
 
 
 # ── Skill views ──────────────────────────────────────────────────────────────
 
 @require_GET
+@cached_response("skills", params=FIELDS_PARAMS, last_modified=_latest_update(Skill))
 def skill_list(request):
-    skills = list(
-        Skill.objects.all().values(
-            "id",
-            "name",
-            "category",
-            "icon_url",
-            "proficiency_level",
-        )
+    try:
+        fields = SKILL_SCHEMA.requested_fields(request)
+    except InvalidFields as exc:
+        return FastJsonResponse({"detail": str(exc)}, status=400)
+    selection = SKILL_SCHEMA.select(fields=fields)
+    return FastJsonResponse(selection.encode_all(selection.queryset), safe=False)
+
+
+def _select_home_skills(fields=None):
+    featured = SKILL_SCHEMA.select(
+        Skill.objects.filter(featured_rank__isnull=False).order_by("featured_rank", "name"),
+        fields,
+        extra=("id",),
     )
-    return JsonResponse(skills, safe=False)
+    rows = list(featured.queryset[:HOME_SKILL_COUNT])
+    if len(rows) < HOME_SKILL_COUNT:
+        id_index = featured.columns.index("id")
+        fallback = (
+            Skill.objects.filter(category__in=HOME_SKILL_FALLBACK_CATEGORIES)
+            .exclude(id__in=[row[id_index] for row in rows])
+            .order_by("-proficiency_level", "category", "name")
+        )
+        rows += SKILL_SCHEMA.select(fallback, featured.fields, extra=("id",)).queryset[
+            : HOME_SKILL_COUNT - len(rows)
+        ]
+    return featured.encode_all(rows)
 
 
 @require_GET
+@cached_response("skills", params=FIELDS_PARAMS, last_modified=_latest_update(Skill))
 def home_skill_list(request):
     try:
-        preferred_names = ["React", "Django", "Python", "PostgreSQL", "REST APIs"]
-        all_skills = list(
-            Skill.objects.all().values(
-                "id",
-                "name",
-                "category",
-                "icon_url",
-                "proficiency_level",
-            )
-        )
+        fields = SKILL_SCHEMA.requested_fields(request)
+    except InvalidFields as exc:
+        return FastJsonResponse({"detail": str(exc)}, status=400)
 
-        selected = []
-        used_ids = set()
-
-        for name in preferred_names:
-            match = next((skill for skill in all_skills if skill["name"] == name), None)
-            if match and match["id"] not in used_ids:
-                selected.append(match)
-                used_ids.add(match["id"])
-
-        if len(selected) < 5:
-            fallback = sorted(
-                (
-                    skill
-                    for skill in all_skills
-                    if skill["id"] not in used_ids
-                    and skill["category"] in {"frontend", "backend", "tools"}
-                ),
-                key=lambda skill: skill.get("proficiency_level", 0),
-                reverse=True,
-            )
-            for skill in fallback:
-                selected.append(skill)
-                if len(selected) == 5:
-                    break
-
-        return JsonResponse(selected[:5], safe=False)
+    try:
+        return FastJsonResponse(_select_home_skills(fields), safe=False)
     except Exception as e:
         logger.error("Error in home_skill_list view: %s", e, exc_info=True)
-        return JsonResponse({"detail": "An internal error occurred."}, status=500)
+        return FastJsonResponse({"detail": "An internal error occurred."}, status=500)
 
 
 # ── Education views ──────────────────────────────────────────────────────────
 
 @require_GET
+@cached_response("education", params=FIELDS_PARAMS, last_modified=_latest_update(Education))
 def education_list(request):
-    education = list(
-        Education.objects.all().values(
-            "id",
-            "degree",
-            "institution",
-            "start_year",
-            "end_year",
-            "description",
-        )
-    )
-    return JsonResponse(education, safe=False)
+    try:
+        fields = EDUCATION_SCHEMA.requested_fields(request)
+    except InvalidFields as exc:
+        return FastJsonResponse({"detail": str(exc)}, status=400)
+    selection = EDUCATION_SCHEMA.select(fields=fields)
+    return FastJsonResponse(selection.encode_all(selection.queryset), safe=False)
 
 
-# ── Contact view ─────────────────────────────────────────────────────────────
+# ── Search view ──────────────────────────────────────────────────────────────
 
-def _client_ip(request):
-    forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
-    if forwarded_for:
-        return forwarded_for.split(",")[0].strip()
-    return request.META.get("REMOTE_ADDR", "unknown")
+def _search_last_modified(request):
+    updates = [_latest_update(Project)(request), _latest_update(Blog)(request)]
+    return max((update for update in updates if update is not None), default=None)
 
 
-@csrf_exempt
-@require_http_methods(["POST"])
-def contact_message_create(request):
-    rate_limit = 5
-    rate_window_seconds = 3600
-    ip = _client_ip(request)
-    rate_key = f"contact:rate:{ip}"
-
-    current_count = cache.get(rate_key, 0)
-    if current_count >= rate_limit:
-        return JsonResponse(
-            {"detail": "Rate limit exceeded. Please try again later."},
-            status=429,
+class InvalidQuery(ValueError):
+    pass
+
+
+def _search_params(request):
+    query = request.GET.get("q", "").strip()
+    if not query:
+        raise InvalidQuery("q is required.")
+    if len(query) > SEARCH_MAX_QUERY_LENGTH:
+        raise InvalidQuery("q is too long.")
+
+    try:
+        limit = int(request.GET.get("limit", SEARCH_DEFAULT_LIMIT))
+    except ValueError:
+        raise InvalidQuery("limit must be an integer.") from None
+    return query, max(1, min(limit, SEARCH_MAX_LIMIT))
+
+
+@require_GET
+@cached_response("projects", "blogs", params=SEARCH_PARAMS, last_modified=_search_last_modified)
+def search(request):
+    try:
+        query, limit = _search_params(request)
+    except InvalidQuery as exc:
+        return FastJsonResponse({"detail": str(exc)}, status=400)
+    return FastJsonResponse({"query": query, "results": search_content(query, limit)})
+
+
+# ── Bootstrap view ───────────────────────────────────────────────────────────
+
+def _list_section(schema, queryset=None, limit=None):
+    def build():
+        selection = schema.select(queryset)
+        return selection.encode_all(selection.queryset[:limit])
+
+    return build
+
+
+# Section name -> (model, builder). Each builder runs one query, except
+# home_skills which needs at most two.
+BOOTSTRAP_SECTIONS = {
+    "projects": (Project, _list_section(PROJECT_SCHEMA, Project.objects.order_by("-created_at", "-id"))),
+    "blogs": (
+        Blog,
+        _list_section(BLOG_SCHEMA, Blog.objects.order_by("-published_on", "-id"), BOOTSTRAP_BLOG_LIMIT),
+    ),
+    "home_skills": (Skill, _select_home_skills),
+    "skills": (Skill, _list_section(SKILL_SCHEMA)),
+    "education": (Education, _list_section(EDUCATION_SCHEMA)),
+}
+BOOTSTRAP_DEFAULT_SECTIONS = ("projects", "blogs", "home_skills", "education")
+
+
+def _bootstrap_sections(request):
+    raw = request.GET.get("sections")
+    if raw is None:
+        return BOOTSTRAP_DEFAULT_SECTIONS
+    names = {name.strip() for name in raw.split(",") if name.strip()}
+    unknown = names.difference(BOOTSTRAP_SECTIONS)
+    if unknown or not names:
+        raise InvalidFields(
+            f"Unknown sections: {', '.join(sorted(unknown))}." if unknown else "sections must not be empty."
         )
+    return tuple(name for name in BOOTSTRAP_SECTIONS if name in names)
+
+
+def _bootstrap_last_modified(request):
+    try:
+        sections = _bootstrap_sections(request)
+    except InvalidFields:
+        return None
+    models = {BOOTSTRAP_SECTIONS[name][0] for name in sections}
+    updates = [_latest_update(model)(request) for model in models]
+    return max((update for update in updates if update is not None), default=None)
+
+
+def build_bootstrap_payload(sections=BOOTSTRAP_DEFAULT_SECTIONS):
+    return {name: BOOTSTRAP_SECTIONS[name][1]() for name in sections}
+
+
+@require_GET
+@cached_response(
+    "projects",
+    "blogs",
+    "skills",
+    "education",
+    params=BOOTSTRAP_PARAMS,
+    last_modified=_bootstrap_last_modified,
+)
+def bootstrap(request):
+    try:
+        sections = _bootstrap_sections(request)
+    except InvalidFields as exc:
+        return FastJsonResponse({"detail": str(exc)}, status=400)
+    return FastJsonResponse(build_bootstrap_payload(sections))
+
+
+# ── Contact view ─────────────────────────────────────────────────────────────
+
+class InvalidContact(ValueError):
+    pass
+
 
+def _contact_fields(body):
+    """Validate a contact submission and return the cleaned fields (also the webhook payload)."""
     try:
-        payload = json.loads(request.body or "{}")
+        payload = json.loads(body or "{}")
     except json.JSONDecodeError:
-        return JsonResponse({"detail": "Invalid JSON payload."}, status=400)
+        raise InvalidContact("Invalid JSON payload.") from None
 
     full_name = str(payload.get("fullName") or payload.get("full_name") or "").strip()
     email = str(payload.get("email", "")).strip()
@@ -262,53 +332,71 @@ def contact_message_create(request):
     phone = str(payload.get("phone", "")).strip()
 
     if len(full_name) < 2 or len(full_name) > 120:
-        return JsonResponse(
-            {"detail": "Full name must be between 2 and 120 characters."}, status=400
-        )
+        raise InvalidContact("Full name must be between 2 and 120 characters.")
 
     try:
         validate_email(email)
     except Exception:
-        return JsonResponse({"detail": "Invalid email address."}, status=400)
+        raise InvalidContact("Invalid email address.") from None
 
     if len(message) < 10 or len(message) > 4000:
-        return JsonResponse(
-            {"detail": "Message must be between 10 and 4000 characters."}, status=400
-        )
+        raise InvalidContact("Message must be between 10 and 4000 characters.")
 
     if len(service) > 120 or len(budget) > 120 or len(timeline) > 120 or len(phone) > 80:
-        return JsonResponse(
-            {"detail": "One or more fields exceed the maximum allowed length."}, status=400
+        raise InvalidContact("One or more fields exceed the maximum allowed length.")
+
+    return {
+        "full_name": full_name,
+        "email": email,
+        "service": service,
+        "budget": budget,
+        "timeline": timeline,
+        "phone": phone,
+        "message": message,
+    }
+
+
+def _create_contact(data):
+    """Store the message and queue its webhook; returns the outbox entry, if any."""
+    with transaction.atomic():
+        contact = ContactMessage.objects.create(
+            name=data["full_name"],
+            email=data["email"],
+            service=data["service"],
+            budget=data["budget"],
+            timeline=data["timeline"],
+            phone=data["phone"],
+            message=data["message"],
         )
+        return enqueue_contact_webhook(contact, data)
 
-    ContactMessage.objects.create(
-        name=full_name,
-        email=email,
-        service=service,
-        budget=budget,
-        timeline=timeline,
-        phone=phone,
-        message=message,
-    )
 
-    _notify_make_webhook(
-        {
-            "full_name": full_name,
-            "email": email,
-            "service": service,
-            "budget": budget,
-            "timeline": timeline,
-            "phone": phone,
-            "message": message,
-        }
-    )
+@csrf_exempt
+@require_http_methods(["POST"])
+@rate_limit("contact", limit=5, window=3600)
+def contact_message_create(request):
+    try:
+        data = _contact_fields(request.body)
+    except InvalidContact as exc:
+        return FastJsonResponse({"detail": str(exc)}, status=400)
 
-    if cache.add(rate_key, 1, timeout=rate_window_seconds):
-        pass
-    else:
-        try:
-            cache.incr(rate_key)
-        except ValueError:
-            cache.set(rate_key, 1, timeout=rate_window_seconds)
+    _create_contact(data)
+    return FastJsonResponse({"detail": "Message submitted successfully."}, status=201)
 
-    return JsonResponse({"detail": "Message submitted successfully."}, status=201)
+
+# ── Metrics view ─────────────────────────────────────────────────────────────
+
+@require_GET
+def metrics(request):
+    """Prometheus scrape endpoint; needs ``Authorization: Bearer <METRICS_TOKEN>``."""
+    token = getattr(settings, "METRICS_TOKEN", "")
+    if not token:
+        raise Http404
+    supplied = request.META.get("HTTP_AUTHORIZATION", "").removeprefix("Bearer ").strip()
+    if not hmac.compare_digest(supplied.encode(), token.encode()):
+        return HttpResponse("Unauthorized", status=401, content_type="text/plain")
+
+    store.flush()
+    return HttpResponse(
+        render_prometheus(collect()), content_type="text/plain; version=0.0.4; charset=utf-8"
+    )
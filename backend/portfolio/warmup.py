@@ -0,0 +1,35 @@
+"""Prime a fresh process before it serves traffic."""
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.test import RequestFactory
+from django.urls import resolve, reverse
+
+from .initial_data import initial_data_script
+
+# Read endpoints that take no slug or required query string.
+LIST_ENDPOINTS = ("project-list", "blog-list", "skill-list", "home-skill-list", "education-list", "bootstrap")
+
+
+def call_view(factory, path):
+    """Run the view for GET ``path`` in-process, without middleware.
+
+    Works for both the sync and the async views (``API_ASYNC_VIEWS``).
+    """
+    match = resolve(path)
+    request = factory.get(path)
+    request.resolver_match = match
+    view = async_to_sync(match.func) if iscoroutinefunction(match.func) else match.func
+    return view(request, *match.args, **match.kwargs)
+
+
+def warm_up():
+    """Fill the response cache for the list endpoints.
+
+    Also builds the home page's inlined initial data. Returns ``{path: status}``.
+    """
+    factory = RequestFactory()
+    statuses = {}
+    for name in LIST_ENDPOINTS:
+        path = reverse(name)
+        statuses[path] = call_view(factory, path).status_code
+    initial_data_script("/")
+    return statuses
@@ -0,0 +1,183 @@
+import logging
+import random
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+from .models import WebhookOutbox
+
+logger = logging.getLogger(__name__)
+
+DELIVERY_FIELDS = ["status", "attempts", "next_attempt_at", "last_status_code", "last_error", "delivered_at"]
+# An inline delivery holds its entry this long before the outbox worker may
+# pick it up again; the worker only takes entries whose next_attempt_at passed.
+INLINE_DELIVERY_LEASE = timedelta(minutes=2)
+
+
+def webhook_url():
+    return getattr(settings, "MAKE_WEBHOOK_URL", "") or ""
+
+
+def enqueue_contact_webhook(contact, contact_data):
+    """Queue a Make.com notification for ``contact``.
+
+    Call inside the transaction that creates the contact so the message and
+    its delivery row are committed together.
+    """
+    if not webhook_url():
+        return None
+    return WebhookOutbox.objects.create(contact_message=contact, payload=contact_data)
+
+
+def build_session():
+    # Only the outbox worker sends with requests; web processes never import it.
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Content-Type": "application/json"})
+    return session
+
+
+def retry_delay(attempts):
+    base = getattr(settings, "WEBHOOK_BACKOFF_BASE_SECONDS", 30)
+    cap = getattr(settings, "WEBHOOK_BACKOFF_MAX_SECONDS", 3600)
+    delay = min(cap, base * 2 ** max(attempts - 1, 0))
+    return timedelta(seconds=delay * random.uniform(0.8, 1.2))
+
+
+def _timeout():
+    return getattr(settings, "WEBHOOK_TIMEOUT", (3.05, 6))
+
+
+def deliver(entry, session):
+    """POST one outbox entry and record the outcome on it (unsaved)."""
+    url = webhook_url()
+    entry.attempts += 1
+    status_code, error = None, ""
+    try:
+        if not url:
+            raise RuntimeError("MAKE_WEBHOOK_URL is not configured.")
+        response = session.post(url, json=entry.payload, timeout=_timeout())
+        status_code = response.status_code
+    except Exception as exc:
+        error = f"{type(exc).__name__}: {exc}"
+    return record_outcome(entry, status_code, error)
+
+
+async def adeliver(entry, session):
+    """``deliver`` over an ``aiohttp.ClientSession``."""
+    import aiohttp
+
+    url = webhook_url()
+    entry.attempts += 1
+    status_code, error = None, ""
+    timeout = _timeout()
+    connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+    try:
+        if not url:
+            raise RuntimeError("MAKE_WEBHOOK_URL is not configured.")
+        async with session.post(
+            url, json=entry.payload, timeout=aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+        ) as response:
+            status_code = response.status
+    except Exception as exc:
+        error = f"{type(exc).__name__}: {exc}"
+    return record_outcome(entry, status_code, error)
+
+
+def record_outcome(entry, status_code, error):
+    """Apply one attempt's result to ``entry``; True when it was delivered."""
+    if status_code is not None:
+        entry.last_status_code = status_code
+        if status_code >= 400:
+            error = f"HTTP {status_code}"
+
+    if not error:
+        entry.status = WebhookOutbox.Status.DELIVERED
+        entry.delivered_at = timezone.now()
+        entry.last_error = ""
+        return True
+
+    entry.last_error = error[:2000]
+    if entry.attempts >= getattr(settings, "WEBHOOK_MAX_ATTEMPTS", 8):
+        entry.status = WebhookOutbox.Status.FAILED
+        logger.error("Make webhook delivery %s failed permanently: %s", entry.pk, error)
+    else:
+        entry.next_attempt_at = timezone.now() + retry_delay(entry.attempts)
+        logger.warning("Make webhook delivery %s failed (attempt %s): %s", entry.pk, entry.attempts, error)
+    return False
+
+
+def claim(entry_id):
+    """Lease a due entry for an inline attempt; False when it is not ours to send.
+
+    The conditional UPDATE waits for a worker holding the row and then sees
+    its outcome, so an entry is never sent by both.
+    """
+    now = timezone.now()
+    leased = WebhookOutbox.objects.filter(
+        pk=entry_id, status=WebhookOutbox.Status.PENDING, next_attempt_at__lte=now
+    ).update(next_attempt_at=now + INLINE_DELIVERY_LEASE)
+    return leased == 1
+
+
+def _claimed_entry(entry_id):
+    try:
+        return WebhookOutbox.objects.get(pk=entry_id) if claim(entry_id) else None
+    finally:
+        close_old_connections()
+
+
+def _save_outcome(entry):
+    try:
+        entry.save(update_fields=DELIVERY_FIELDS)
+    finally:
+        close_old_connections()
+
+
+async def deliver_now(entry_id):
+    """Attempt a queued entry immediately, from an async view.
+
+    Runs after the response, outside any request, so it closes its own DB
+    connections. A failed attempt is left to the outbox worker with the usual
+    backoff.
+    """
+    import aiohttp
+
+    entry = await sync_to_async(_claimed_entry)(entry_id)
+    if entry is None:
+        return False
+    async with aiohttp.ClientSession() as session:
+        delivered = await adeliver(entry, session)
+    await sync_to_async(_save_outcome)(entry)
+    return delivered
+
+
+def process_due(session, batch_size=20):
+    """Deliver up to ``batch_size`` due entries and return how many were attempted.
+
+    Each entry is claimed with SKIP LOCKED in its own short transaction, so
+    several workers can drain the outbox without sending a notification twice.
+    """
+    attempted = 0
+    while attempted < batch_size:
+        with transaction.atomic():
+            entry = (
+                WebhookOutbox.objects.select_for_update(skip_locked=True)
+                .filter(status=WebhookOutbox.Status.PENDING, next_attempt_at__lte=timezone.now())
+                .order_by("next_attempt_at")
+                .first()
+            )
+            if entry is None:
+                break
+            deliver(entry, session)
+            entry.save(update_fields=DELIVERY_FIELDS)
+        attempted += 1
+    return attempted
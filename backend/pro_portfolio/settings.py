@@ -46,8 +46,10 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "portfolio.middleware.RequestMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
-    "whitenoise.middleware.WhiteNoiseMiddleware",
+    "portfolio.middleware.StaticFilesMiddleware",
+    "portfolio.middleware.ApiCompressionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -79,7 +81,17 @@ TEMPLATES = [
     },
 ]
 
+# --- ASGI ---
+# Route the API to the async views in portfolio/async_views.py. Turn this on
+# when serving pro_portfolio.asgi with uvicorn workers (see README); under WSGI
+# the sync views avoid the per-request event loop.
+API_ASYNC_VIEWS = env.bool("API_ASYNC_VIEWS", default=False)
+
 # --- DATABASE ---
+# Persistent connections are per-thread under WSGI but per-request context
+# under ASGI, where they would pile up, so async mode closes them each request.
+DB_CONN_MAX_AGE = 0 if API_ASYNC_VIEWS else 600
+
 # Check for DATABASE_URL, but fall back to individual PG variables
 DATABASE_URL = env("DATABASE_URL", default=None) or env("POSTGRES_URL", default=None)
 
@@ -89,7 +101,7 @@ if DATABASE_URL and "postgresql" in DATABASE_URL.lower():
     DATABASES = {
         "default": dj_database_url.config(
             default=DATABASE_URL,
-            conn_max_age=600,
+            conn_max_age=DB_CONN_MAX_AGE,
             ssl_require=False  # Enforce SSL for security
         )
     }
@@ -103,13 +115,25 @@ else:
             "PASSWORD": env("DB_PASSWORD", default=env("PGPASSWORD", default="")),
             "HOST": env("DB_HOST", default=env("PGHOST", default="localhost")),
             "PORT": env("DB_PORT", default=env("PGPORT", default="5432")),
-            "CONN_MAX_AGE": 600,
+            "CONN_MAX_AGE": DB_CONN_MAX_AGE,
         }
     }
 
 # --- STATIC & MEDIA SETTINGS ---
 STATIC_URL = "/static/"
 STATIC_ROOT = BASE_DIR / "staticfiles"
+MEDIA_URL = "/media/"
+MEDIA_ROOT = Path(env("MEDIA_ROOT", default=str(BASE_DIR / "media")))
+
+# `manage.py generate_image_variants` (and Project/Blog saves) write resized
+# WebP/AVIF copies of images under MEDIA_ROOT to MEDIA_ROOT/variants/.
+IMAGE_VARIANT_WIDTHS = (320, 640, 960, 1280)
+IMAGE_VARIANT_QUALITY = env.int("IMAGE_VARIANT_QUALITY", default=70)
+
+# `manage.py export_api_snapshot` writes content-hashed JSON renders of every read
+# endpoint here; with API_SNAPSHOT_MODE on, the API views serve them directly.
+API_SNAPSHOT_DIR = STATIC_ROOT / "api-snapshot"
+API_SNAPSHOT_MODE = env.bool("API_SNAPSHOT_MODE", default=False)
 
 STATICFILES_DIRS = [
     BASE_DIR / "frontend" / "dist",
@@ -168,6 +192,58 @@ else:
         }
     }
 
+# Number of reverse proxies in front of the app that append to X-Forwarded-For
+# (Railway's edge is one). Used by the rate limiter to find the client address.
+RATELIMIT_TRUSTED_PROXY_COUNT = env.int("RATELIMIT_TRUSTED_PROXY_COUNT", default=1)
+
+# Read endpoints cache their encoded responses; entries are invalidated by
+# model signals, so the timeout only bounds memory for unused keys.
+API_CACHE_ENABLED = env.bool("API_CACHE_ENABLED", default=True)
+API_CACHE_TIMEOUT = env.int("API_CACHE_TIMEOUT", default=86400)
+
+# gzip/brotli for /api/ responses. Cached responses store their compressed
+# variants alongside the body, so identical bodies are compressed only once.
+API_COMPRESSION_MIN_SIZE = env.int("API_COMPRESSION_MIN_SIZE", default=1024)
+API_GZIP_LEVEL = 6
+API_BROTLI_QUALITY = 5
+
+# Keyset pagination for list endpoints. With API_PAGINATE_LISTS off, lists are
+# only paginated when the client sends ?limit= or ?cursor=.
+API_PAGINATE_LISTS = env.bool("API_PAGINATE_LISTS", default=False)
+API_PAGE_SIZE = env.int("API_PAGE_SIZE", default=20)
+API_MAX_PAGE_SIZE = env.int("API_MAX_PAGE_SIZE", default=100)
+
+# RequestMetricsMiddleware: each worker process writes its per-URL-name totals
+# to METRICS_DIR every METRICS_FLUSH_INTERVAL seconds; GET /metrics sums them
+# in Prometheus text format. Scraping is disabled unless METRICS_TOKEN is set.
+METRICS_DIR = Path(env("METRICS_DIR", default="/tmp/portfolio-metrics"))
+METRICS_FLUSH_INTERVAL = env.float("METRICS_FLUSH_INTERVAL", default=5.0)
+METRICS_TOKEN = env("METRICS_TOKEN", default="")
+
+# ColdStartTests fails when importing pro_portfolio.wsgi takes longer than
+# this. Heavy libraries (markdown, bleach, Pillow, requests, aiohttp) are
+# imported where they are used, so new workers and deploys start fast.
+IMPORT_TIME_BUDGET_MS = env.int("IMPORT_TIME_BUDGET_MS", default=800)
+
+# Cache-Control directives per URL name ("default" applies to the rest).
+API_CACHE_CONTROL = {
+    "default": {
+        "public": True,
+        "max_age": env.int("API_CACHE_MAX_AGE", default=60),
+        "stale_while_revalidate": env.int("API_CACHE_STALE_WHILE_REVALIDATE", default=600),
+    },
+    "project-detail": {
+        "public": True,
+        "max_age": env.int("API_CACHE_MAX_AGE", default=60),
+        "stale_while_revalidate": 3600,
+    },
+    "blog-detail": {
+        "public": True,
+        "max_age": env.int("API_CACHE_MAX_AGE", default=60),
+        "stale_while_revalidate": 3600,
+    },
+}
+
 # --- PRODUCTION SECURITY SETTINGS ---
 SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
 X_FRAME_OPTIONS = "DENY"
@@ -205,3 +281,8 @@ USE_TZ = True
 # Make.com: webhook to notify you on new contact submissions.
 # Keep this out of source control and set it via environment variables.
 MAKE_WEBHOOK_URL = env("MAKE_WEBHOOK_URL", default="")
+# Deliveries are queued in WebhookOutbox and sent by `manage.py process_webhook_outbox`.
+WEBHOOK_TIMEOUT = (3.05, 6)
+WEBHOOK_MAX_ATTEMPTS = env.int("WEBHOOK_MAX_ATTEMPTS", default=8)
+WEBHOOK_BACKOFF_BASE_SECONDS = env.int("WEBHOOK_BACKOFF_BASE_SECONDS", default=30)
+WEBHOOK_BACKOFF_MAX_SECONDS = env.int("WEBHOOK_BACKOFF_MAX_SECONDS", default=3600)
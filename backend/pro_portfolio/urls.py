@@ -18,16 +18,20 @@ from django.contrib import admin
 from django.conf import settings
 from django.conf.urls.static import static
 from django.urls import include, path, re_path
-from django.views.generic import TemplateView
+
+from portfolio.views import metrics
+
+from .views import SpaShellView
 
 admin_prefix = settings.ADMIN_URL.strip("/")
 
 urlpatterns = [
     path(settings.ADMIN_URL, admin.site.urls),
     path("api/", include("portfolio.urls")),
-    # Catch-all: serve React index.html for any other route
-    path('', TemplateView.as_view(template_name='index.html')),
-    re_path(r'^.*$', TemplateView.as_view(template_name='index.html')),
+    path("metrics", metrics, name="metrics"),
+    # Catch-all: serve React index.html (with inlined initial data) for any other route
+    path('', SpaShellView.as_view()),
+    re_path(r'^.*$', SpaShellView.as_view()),
 ]
 
 # Serve media files in development only
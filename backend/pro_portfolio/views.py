@@ -1,8 +1,83 @@
-from django.views.generic import TemplateView
+import hashlib
+import logging
+import os
+import re
+import threading
+
+from django.http import HttpResponse, HttpResponseNotFound
+from django.template.loader import get_template
+from django.utils.cache import get_conditional_response
 from django.utils.decorators import method_decorator
+from django.views import View
 from django.views.decorators.csrf import ensure_csrf_cookie
+from django.views.generic import TemplateView
+
+from portfolio.initial_data import embed, initial_data_script
+
+logger = logging.getLogger(__name__)
+
+# Paths that can only be files: anything under the static prefixes, or a last
+# segment with an extension (stale hashed bundles, /wp-login.php probes).
+ASSET_PATH_RE = re.compile(r"^/(?:static|assets)/|\.[A-Za-z0-9]+/?$")
 
 
 @method_decorator(ensure_csrf_cookie, name="dispatch")
 class ReactAppView(TemplateView):
     template_name = "react/index.html"
+
+
+class ShellTemplate:
+    """The rendered ``index.html`` kept in memory, re-read when its file changes."""
+
+    def __init__(self, template_name):
+        self.template_name = template_name
+        self._lock = threading.Lock()
+        self._mtime = None
+        self._path = None
+        self._content = None
+
+    def _current_mtime(self):
+        try:
+            return os.stat(self._path).st_mtime_ns
+        except (OSError, TypeError):
+            return None
+
+    def content(self):
+        if self._content is not None and self._current_mtime() == self._mtime:
+            return self._content
+        with self._lock:
+            mtime = self._current_mtime()
+            if self._content is None or mtime != self._mtime:
+                template = get_template(self.template_name)
+                # The cached template loader never re-reads the file, so
+                # compile the current source from the resolved path instead.
+                self._path = template.origin.name
+                self._mtime = self._current_mtime()
+                with open(self._path, encoding="utf-8") as source:
+                    self._content = template.backend.from_string(source.read()).render().encode("utf-8")
+            return self._content
+
+
+class SpaShellView(View):
+    """Serve the React ``index.html`` with the route's initial data inlined."""
+
+    http_method_names = ["get", "head"]
+    shell = ShellTemplate("index.html")
+
+    def get(self, request, *args, **kwargs):
+        if ASSET_PATH_RE.search(request.path):
+            return HttpResponseNotFound(b"Not Found", content_type="text/plain")
+
+        try:
+            script = initial_data_script(request.path)
+        except Exception as e:
+            # The SPA fetches anything missing, so fall back to the bare shell.
+            logger.error("Error building initial data for %s: %s", request.path, e, exc_info=True)
+            script = b""
+        content = embed(self.shell.content(), script)
+        etag = f'"{hashlib.sha256(content).hexdigest()}"'
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = HttpResponse(content, content_type="text/html; charset=utf-8")
+        response["ETag"] = etag
+        return response
@@ -5,11 +5,8 @@ cd backend
 pip install -r requirements.txt
 python manage.py collectstatic --noinput
 python manage.py migrate
-```
-
----
-
-**`Procfile` — clean and simple**
-```
-build: bash build.sh
-web: cd backend && gunicorn pro_portfolio.wsgi
\ No newline at end of file
+python manage.py backfill_description_html
+python manage.py generate_image_variants
+python manage.py export_api_snapshot
+# Fails the deploy if a read endpoint errors; fills a shared (Redis) cache.
+python manage.py warm_cache
@@ -30,9 +30,37 @@ api.interceptors.request.use((config) => {
   return config;
 });
 
+// Data inlined into index.html by the server for the first route rendered.
+// Each key is handed out once so later navigations fetch fresh data.
+let initialData;
+
+const takeInitialData = (key) => {
+  if (initialData === undefined) {
+    initialData = {};
+    const element = document.getElementById('initial-data');
+    if (element) {
+      try {
+        const parsed = JSON.parse(element.textContent);
+        if (parsed.path === window.location.pathname) {
+          initialData = parsed.data || {};
+        }
+      } catch {
+        initialData = {};
+      }
+    }
+  }
+  const value = initialData[key];
+  delete initialData[key];
+  return value;
+};
+
 // ... existing code ...
 
 export const getProjects = async () => {
+  const initial = takeInitialData('projects');
+  if (initial) {
+    return initial;
+  }
   try {
     const response = await api.get('/projects/');
     return response.data;
@@ -44,6 +72,10 @@ export const getProjects = async () => {
 
 
 export const getProject = async (slug) => {
+  const initial = takeInitialData('project');
+  if (initial && initial.slug === slug) {
+    return initial;
+  }
   try {
     const response = await api.get(`/projects/${slug}/`);
     return response.data;
@@ -64,6 +96,10 @@ export const getBlogs = async () => {
 };
 
 export const getBlog = async (slug) => {
+  const initial = takeInitialData('blog');
+  if (initial && initial.slug === slug) {
+    return initial;
+  }
   try {
     const response = await api.get(`/blogs/${slug}/`);
     return response.data;
@@ -73,4 +109,13 @@ export const getBlog = async (slug) => {
   }
 };
 
+export const getHomeSkills = async () => {
+  const initial = takeInitialData('home_skills');
+  if (initial) {
+    return initial;
+  }
+  const response = await api.get('/skills/home/');
+  return response.data;
+};
+
 export default api;
@@ -144,7 +144,14 @@ const BlogDetails = () => {
 
         <section className="mb-8">
           <h2 className="text-2xl font-semibold text-white mb-3">Build Story</h2>
-          <p className="text-[#E0E0E0] leading-relaxed">{article.story}</p>
+          {article.story_html ? (
+            <div
+              className="text-[#E0E0E0] leading-relaxed"
+              dangerouslySetInnerHTML={{ __html: article.story_html }}
+            />
+          ) : (
+            <p className="text-[#E0E0E0] leading-relaxed">{article.story}</p>
+          )}
         </section>
 
         <section className="mb-8">
@@ -2,7 +2,7 @@ import { useEffect, useMemo, useState } from 'react';
 import { Link } from 'react-router-dom';
 import { FaBrain, FaCode, FaDatabase, FaDocker, FaExternalLinkAlt, FaPython, FaReact } from 'react-icons/fa';
 import { SiDjango, SiFlutter, SiTensorflow } from 'react-icons/si';
-import api, { getProjects } from '../lib/api';
+import { getHomeSkills, getProjects } from '../lib/api';
 
 
 const CATEGORY_LABELS = {
@@ -209,8 +209,8 @@ const Home = () => {
       try {
         setSkillsLoading(true);
         setSkillsError('');
-        const response = await api.get('/skills/home/');
-        const data = Array.isArray(response.data) ? response.data : [];
+        const response = await getHomeSkills();
+        const data = Array.isArray(response) ? response : [];
 
         if (isMounted) {
           const normalized = data.map((item) => ({